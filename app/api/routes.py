@@ -12,36 +12,135 @@ Design principles:
 - Consistent error responses
 - Request/response validation via Pydantic
 """
+import asyncio
 import logging
-from typing import Annotated
+import time
+from typing import Annotated, Any
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from fastapi.responses import JSONResponse
+import msgspec
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from pydantic import BaseModel, TypeAdapter
 
+from app.batching import get_rag_proxy
+from app.cache import get_response_cache
 from app.core.config import Settings, get_settings
+from app.core.responses import OrjsonResponse
 from app.mcp_tools import get_tool_registry
 from app.models import (
+    OPTIMIZATION_RESPONSE_ADAPTER,
+    SIMILAR_AIRFOIL_RESPONSE_ADAPTER,
     OptimizationResponse,
     SimilarAirfoilRequest,
     SimilarAirfoilResponse,
+    ToolInput,
+    ToolOutput,
     WingSpecification,
 )
 from app.rag import get_rag_engine
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/api/v1", tags=["aerodynamic-analysis"])
+router = APIRouter(
+    prefix="/api/v1",
+    tags=["aerodynamic-analysis"],
+    default_response_class=OrjsonResponse
+)
 
 
 # Dependency injection
-def get_rag_engine_dep():
+#
+# The app lifespan builds the RAG engine, response cache, batching proxy and
+# tool registry at startup and publishes them on ``app.state``; the providers
+# below just read them back. They fall back to the module singletons when the
+# app runs without its lifespan (e.g. a TestClient used outside ``with``).
+# The providers stay as callables so tests can still swap them via
+# app.dependency_overrides, and they are declared async because FastAPI runs
+# plain ``def`` dependencies in the threadpool. Settings and the tool registry
+# are also resolved at import, since tool routes are generated from the registry.
+_settings: Settings = get_settings()
+_tool_registry = get_tool_registry(_settings)
+
+
+async def get_settings_dep(request: Request) -> Settings:
+    """Dependency to inject application settings."""
+    return getattr(request.app.state, "settings", _settings)
+
+
+async def get_rag_engine_dep(request: Request):
     """Dependency to inject RAG engine."""
-    return get_rag_engine()
+    rag_engine = getattr(request.app.state, "rag_engine", None)
+    return rag_engine if rag_engine is not None else get_rag_engine(_settings)
 
 
-def get_tool_registry_dep():
+async def get_tool_registry_dep(request: Request):
     """Dependency to inject tool registry."""
-    return get_tool_registry()
+    return getattr(request.app.state, "tool_registry", _tool_registry)
+
+
+async def get_response_cache_dep(request: Request):
+    """Dependency to inject the semantic response cache."""
+    response_cache = getattr(request.app.state, "response_cache", None)
+    return response_cache if response_cache is not None else get_response_cache(_settings)
+
+
+async def get_rag_proxy_dep(request: Request):
+    """Dependency to inject the batching RAG search proxy."""
+    rag_proxy = getattr(request.app.state, "rag_proxy", None)
+    return rag_proxy if rag_proxy is not None else get_rag_proxy(_settings)
+
+
+def _model_response(
+    adapter: TypeAdapter,
+    model: BaseModel,
+    status_code: int = status.HTTP_200_OK
+) -> Response:
+    """
+    Serialize a response model directly to JSON bytes.
+    
+    Handlers that already build the exact response model return this instead
+    of declaring ``response_model``, which would make FastAPI validate and
+    dump the model a second time. Routes document the model via ``responses``.
+    
+    Args:
+        adapter: Module-level TypeAdapter for the model's type (see app.models)
+        model: Fully built response model
+        status_code: HTTP status code for the response
+        
+    Returns:
+        Response: JSON response with the serialized model
+    """
+    return Response(
+        content=adapter.dump_json(model),
+        status_code=status_code,
+        media_type="application/json"
+    )
+
+
+def _tool_response(output: ToolOutput) -> Response:
+    """
+    Encode a tool output directly to JSON bytes with msgspec.
+    
+    Args:
+        output: Tool execution result
+        
+    Returns:
+        Response: JSON response with the encoded output
+    """
+    return Response(content=msgspec.json.encode(output), media_type="application/json")
+
+
+# ToolOutput is a msgspec Struct rather than a Pydantic model, so tool routes
+# document it through ``responses`` with msgspec's own JSON schema.
+_TOOL_OUTPUT_RESPONSES: dict[int | str, dict[str, Any]] = {
+    status.HTTP_200_OK: {
+        "description": "Tool execution result",
+        "content": {
+            "application/json": {
+                "schema": msgspec.json.schema_components([ToolOutput])[1]["ToolOutput"]
+            }
+        },
+    }
+}
 
 
 # ============================================================================
@@ -50,11 +149,11 @@ def get_tool_registry_dep():
 
 @router.get(
     "/health",
-    response_model=dict,
+    response_model=None,
     summary="Health Check",
     description="Check if the API is running and accessible"
 )
-async def health_check(settings: Annotated[Settings, Depends(get_settings)]) -> dict:
+def health_check(settings: Annotated[Settings, Depends(get_settings_dep)]) -> dict:
     """
     Health check endpoint.
     
@@ -75,7 +174,8 @@ async def health_check(settings: Annotated[Settings, Depends(get_settings)]) ->
 
 @router.post(
     "/optimize-wing",
-    response_model=OptimizationResponse,
+    response_model=None,
+    responses={status.HTTP_202_ACCEPTED: {"model": OptimizationResponse}},
     status_code=status.HTTP_202_ACCEPTED,
     summary="Optimize Wing Configuration",
     description="Submit a wing specification for aerodynamic optimization analysis"
@@ -83,7 +183,7 @@ async def health_check(settings: Annotated[Settings, Depends(get_settings)]) ->
 async def optimize_wing(
     request: WingSpecification,
     rag_engine=Depends(get_rag_engine_dep)
-) -> OptimizationResponse:
+) -> Response:
     """
     Analyze a wing design and provide optimization recommendations.
     
@@ -97,7 +197,8 @@ async def optimize_wing(
         request: Wing specification parameters
         
     Returns:
-        OptimizationResponse: Recommended airfoil and performance estimate
+        Response: Serialized OptimizationResponse (recommended airfoil and
+        performance estimate)
         
     Status Codes:
         202: Accepted - Analysis will proceed
@@ -115,7 +216,7 @@ async def optimize_wing(
             "operating_speed_kph": 200
         }
     """
-    logger.info(f"Optimization request: {request}")
+    logger.info("Optimization request: %s", request)
     
     try:
         # Placeholder implementation - to be filled in Week 1 development
@@ -123,7 +224,8 @@ async def optimize_wing(
         # 1. Call RAG search for similar designs
         # 2. Call MCP tools for performance estimation
         # 3. Aggregate results and reasoning
-        # 4. Return OptimizationResponse
+        # 4. Return _model_response(OPTIMIZATION_RESPONSE_ADAPTER, response,
+        #    status.HTTP_202_ACCEPTED)
         
         raise NotImplementedError("Optimization endpoint implementation pending")
         
@@ -133,7 +235,7 @@ async def optimize_wing(
             detail="Optimization service not yet implemented"
         )
     except Exception as e:
-        logger.error(f"Optimization failed: {e}")
+        logger.error("Optimization failed: %s", e)
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="Optimization service error"
@@ -146,26 +248,30 @@ async def optimize_wing(
 
 @router.post(
     "/find-similar-airfoils",
-    response_model=SimilarAirfoilResponse,
+    response_model=None,
+    responses={status.HTTP_200_OK: {"model": SimilarAirfoilResponse}},
     summary="Find Similar Airfoil Designs",
     description="Search for aerodynamic designs similar to your specification"
 )
 async def find_similar_airfoils(
     request: SimilarAirfoilRequest,
-    rag_engine=Depends(get_rag_engine_dep)
-) -> SimilarAirfoilResponse:
+    rag_proxy=Depends(get_rag_proxy_dep)
+) -> Response:
     """
     Find airfoil profiles similar to the provided wing specification.
     
     Uses RAG (Retrieval-Augmented Generation) to search the aerodynamic
-    knowledge base for comparable designs.
+    knowledge base for comparable designs. Concurrent requests are batched
+    by the RAG proxy, and near-identical queries are served from the
+    semantic response cache.
     
     Args:
         request: Wing specification and search parameters
-        rag_engine: Injected RAG engine instance
+        rag_proxy: Injected batching RAG proxy
         
     Returns:
-        SimilarAirfoilResponse: List of similar designs with relevance scores
+        Response: Serialized SimilarAirfoilResponse (similar designs with
+        relevance scores)
         
     Example:
         POST /api/v1/find-similar-airfoils
@@ -180,24 +286,22 @@ async def find_similar_airfoils(
             "limit": 5
         }
     """
-    logger.info(f"Similar airfoil search: {request}")
+    logger.info("Similar airfoil search: %s", request)
+    start_ns = time.perf_counter_ns()
     
     try:
-        # Placeholder implementation - to be filled in Week 1 development
-        # This will:
-        # 1. Format wing spec as search query
-        # 2. Call RAG engine to find similar designs
-        # 3. Parse results and format as SimilarAirfoilResponse
-        
-        raise NotImplementedError("RAG search implementation pending")
+        results = await rag_proxy.submit(request)
         
-    except NotImplementedError:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="RAG search not yet implemented"
+        # Request already validated and results built by the engine
+        response = SimilarAirfoilResponse.model_construct(
+            query_spec=request.wing_spec,
+            results=results,
+            search_time_ms=(time.perf_counter_ns() - start_ns) / 1_000_000
         )
+        return _model_response(SIMILAR_AIRFOIL_RESPONSE_ADAPTER, response)
+        
     except Exception as e:
-        logger.error(f"RAG search failed: {e}")
+        logger.error("RAG search failed: %s", e)
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="Search service error"
@@ -213,7 +317,7 @@ async def find_similar_airfoils(
     summary="List Available Tools",
     description="Get list of available MCP tools with schemas"
 )
-async def list_tools(
+def list_tools(
     tool_registry=Depends(get_tool_registry_dep)
 ) -> dict:
     """
@@ -236,14 +340,81 @@ async def list_tools(
             ]
         }
     """
+    tools = tool_registry.list_tools()
     return {
-        "tools": tool_registry.list_tools(),
-        "count": len(tool_registry.list_tools())
+        "tools": tools,
+        "count": len(tools)
     }
 
 
+def _make_tool_endpoint(tool_name: str, input_model: type[ToolInput]):
+    """
+    Build a POST handler whose request body is the tool's own input model.
+    
+    FastAPI validates the body against ``input_model`` once (in pydantic-core),
+    so the handler can pass the validated fields straight to the tool.
+    
+    Args:
+        tool_name: Identifier of the tool the handler executes
+        input_model: Pydantic model describing the tool inputs
+        
+    Returns:
+        Coroutine function suitable for ``router.add_api_route``
+    """
+    async def execute_registered_tool(
+        inputs: ToolInput,
+        tool_registry=Depends(get_tool_registry_dep)
+    ) -> Response:
+        logger.info("Tool execution request: %s with inputs: %s", tool_name, inputs)
+        try:
+            output = await tool_registry.execute_tool(tool_name, **inputs.model_dump())
+            return _tool_response(output)
+        except ValueError as e:
+            logger.warning("Invalid tool request: %s", e)
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
+        except Exception as e:
+            logger.error("Tool execution failed: %s", e)
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Tool execution error"
+            )
+
+    # FastAPI reads the body model from the annotations; the concrete model is
+    # only known here, so it replaces the static ToolInput base
+    execute_registered_tool.__annotations__["inputs"] = input_model
+    return execute_registered_tool
+
+
+def _register_tool_routes(tool_registry) -> None:
+    """
+    Register a typed POST /tools/{name} route for every registered tool.
+    
+    Must run before the generic ``/tools/{tool_name}`` route is declared so
+    the typed routes take precedence when Starlette matches paths.
+    """
+    for tool in tool_registry.get_tools():
+        router.add_api_route(
+            f"/tools/{tool.name}",
+            _make_tool_endpoint(tool.name, tool.input_model),
+            methods=["POST"],
+            response_model=None,
+            responses=_TOOL_OUTPUT_RESPONSES,
+            summary=f"Execute {tool.name}",
+            description=tool.description,
+            name=f"execute_{tool.name}",
+        )
+
+
+_register_tool_routes(_tool_registry)
+
+
 @router.post(
     "/tools/{tool_name}",
+    response_model=None,
+    responses=_TOOL_OUTPUT_RESPONSES,
     summary="Execute MCP Tool",
     description="Execute a specific MCP tool with provided inputs"
 )
@@ -251,17 +422,21 @@ async def execute_tool(
     tool_name: str,
     inputs: dict,
     tool_registry=Depends(get_tool_registry_dep)
-) -> JSONResponse:
+) -> Response:
     """
     Execute an MCP tool and return results.
     
+    Tools known at startup are served by their typed routes (see
+    ``_register_tool_routes``); this route handles anything else, validating
+    the inputs against the tool's input model before execution.
+    
     Args:
         tool_name: Identifier of the tool to execute
         inputs: Tool-specific input parameters
         tool_registry: Injected tool registry
         
     Returns:
-        JSONResponse: Tool execution result
+        Response: JSON-encoded ToolOutput
         
     Status Codes:
         200: Success
@@ -277,30 +452,25 @@ async def execute_tool(
             "span_mm": 1400
         }
     """
-    logger.info(f"Tool execution request: {tool_name} with inputs: {inputs}")
+    logger.info("Tool execution request: %s with inputs: %s", tool_name, inputs)
     
     try:
-        # Placeholder implementation
-        # This will:
-        # 1. Validate tool exists
-        # 2. Execute tool with inputs
-        # 3. Return formatted result
+        tool = tool_registry.get_tool(tool_name)
+        if tool is None:
+            raise ValueError(f"Tool '{tool_name}' not found")
         
-        raise NotImplementedError("Tool execution implementation pending")
+        validated = tool.input_model.model_validate(inputs)
+        output = await tool_registry.execute_tool(tool_name, **validated.model_dump())
+        return _tool_response(output)
         
     except ValueError as e:
-        logger.warning(f"Invalid tool request: {e}")
+        logger.warning("Invalid tool request: %s", e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
-    except NotImplementedError:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="Tool execution not yet implemented"
-        )
     except Exception as e:
-        logger.error(f"Tool execution failed: {e}")
+        logger.error("Tool execution failed: %s", e)
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="Tool execution error"
@@ -319,11 +489,15 @@ async def execute_tool(
 )
 async def clear_rag_cache(
     rag_engine=Depends(get_rag_engine_dep),
-    settings: Annotated[Settings, Depends(get_settings)] = None
+    response_cache=Depends(get_response_cache_dep),
+    settings: Annotated[Settings, Depends(get_settings_dep)] = None
 ) -> None:
     """
     Clear the RAG vector database cache.
     
+    Also drops the semantic response cache, whose entries would otherwise
+    refer to documents that no longer exist.
+    
     CAUTION: This is destructive and should only be used in development.
     
     Returns:
@@ -340,10 +514,11 @@ async def clear_rag_cache(
         )
     
     try:
-        rag_engine.clear_collection()
+        await asyncio.to_thread(rag_engine.clear_collection)
+        response_cache.clear()
         logger.warning("RAG cache cleared")
     except Exception as e:
-        logger.error(f"Failed to clear cache: {e}")
+        logger.error("Failed to clear cache: %s", e)
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="Cache clear failed"
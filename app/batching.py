@@ -0,0 +1,247 @@
+"""
+Request batching for RAG similarity searches.
+
+Concurrent /find-similar-airfoils requests each need an embedding call and a
+vector database query. BatchingRAGProxy collects requests that arrive within a
+short window and serves them together:
+
+1. Embed all query texts with one async embeddings API call
+2. Reuse cached search matches from the semantic response cache
+3. Order the remaining queries by embedding proximity, so neighbouring
+   queries touch overlapping parts of the index
+4. Run one multi-query vector search and resolve each request's future
+
+Performance estimates are always computed from each request's own wing
+specification, including on cache hits, since nearby specifications share
+cached matches.
+"""
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+from app.cache import Matches, SemanticResponseCache, get_response_cache
+from app.core.config import Settings, get_settings
+from app.models import SimilarAirfoilRequest, SimilarConfigurationResult
+from app.rag import RAGEngine, get_rag_engine
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class _PendingSearch:
+    """A submitted search waiting for the next batch flush."""
+    request: SimilarAirfoilRequest
+    query_text: str
+    future: asyncio.Future
+
+
+def _order_by_proximity(embeddings: list) -> list[int]:
+    """
+    Order embeddings so each one is followed by its nearest remaining neighbour.
+
+    Greedy nearest-neighbour chain over cosine similarity; batches are small
+    (bounded by rag_batch_max_size) so the quadratic cost is negligible.
+
+    Args:
+        embeddings: Query embedding vectors
+
+    Returns:
+        list[int]: Indices into embeddings in visiting order
+    """
+    if len(embeddings) <= 2:
+        return list(range(len(embeddings)))
+
+    vectors = np.asarray(embeddings, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    unit_vectors = vectors / np.where(norms == 0, 1.0, norms)
+    similarities = unit_vectors @ unit_vectors.T
+
+    order = [0]
+    remaining = np.ones(len(embeddings), dtype=bool)
+    remaining[0] = False
+    while remaining.any():
+        candidates = np.where(remaining, similarities[order[-1]], -np.inf)
+        nearest = int(np.argmax(candidates))
+        order.append(nearest)
+        remaining[nearest] = False
+    return order
+
+
+class BatchingRAGProxy:
+    """
+    Coalesces concurrent similarity searches into batched RAG calls.
+
+    Responsibilities:
+    - Queue submitted searches for up to ``window_ms`` (or ``max_batch_size``)
+    - Embed queued queries in one call and consult the response cache
+    - Run the cache misses as one multi-query vector search
+    - Await embeddings asynchronously and keep blocking database calls off
+      the event loop
+    """
+
+    def __init__(
+        self,
+        rag_engine: RAGEngine,
+        response_cache: SemanticResponseCache,
+        window_ms: float,
+        max_batch_size: int
+    ):
+        """
+        Initialize the proxy.
+
+        Args:
+            rag_engine: Engine used for embedding and vector search
+            response_cache: Semantic cache consulted before searching
+            window_ms: How long to wait for more requests before flushing
+            max_batch_size: Flush immediately once this many are queued
+        """
+        self.rag_engine = rag_engine
+        self.response_cache = response_cache
+        self.window_s = window_ms / 1000
+        self.max_batch_size = max(1, max_batch_size)
+        self._pending: list[_PendingSearch] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # Strong references so in-flight flush tasks are not garbage collected
+        self._flush_tasks: set[asyncio.Task] = set()
+
+    async def submit(self, request: SimilarAirfoilRequest) -> list[SimilarConfigurationResult]:
+        """
+        Queue a search and wait for its results.
+
+        Args:
+            request: Wing specification and result limit
+
+        Returns:
+            list[SimilarConfigurationResult]: Ranked similar configurations
+
+        Raises:
+            Exception: Whatever the batched embedding or search raised
+        """
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # A previous event loop (e.g. an earlier test client) went away
+            # with searches still queued; they can never be flushed.
+            self._pending = []
+            self._flush_handle = None
+            self._loop = loop
+
+        future = loop.create_future()
+        self._pending.append(
+            _PendingSearch(request, request.wing_spec.to_query_text(), future)
+        )
+
+        if len(self._pending) >= self.max_batch_size:
+            self._start_flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.window_s, self._start_flush)
+
+        return await future
+
+    def _start_flush(self) -> None:
+        """Detach the queued searches and process them in a background task."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.get_running_loop().create_task(self._flush(batch))
+            self._flush_tasks.add(task)
+            task.add_done_callback(self._flush_tasks.discard)
+
+    async def _flush(self, batch: list[_PendingSearch]) -> None:
+        """
+        Serve a batch of searches.
+
+        Args:
+            batch: Searches detached from the queue
+        """
+        try:
+            embeddings = await self.rag_engine.aembed_batch(
+                [item.query_text for item in batch]
+            )
+
+            misses = []
+            for item, embedding in zip(batch, embeddings):
+                cached = self.response_cache.get(embedding, item.request.limit)
+                if cached is not None:
+                    self._resolve_matches(item, cached)
+                else:
+                    misses.append((item, embedding))
+
+            if misses:
+                ordered = [misses[i] for i in _order_by_proximity([e for _, e in misses])]
+                # Threshold filtering keeps a prefix of the distance-sorted
+                # matches, so one query at the largest limit can be truncated
+                # per request without changing results.
+                limit = max(item.request.limit for item, _ in ordered)
+                matches = await asyncio.to_thread(
+                    self.rag_engine.search_by_embeddings, [e for _, e in ordered], limit
+                )
+                for (item, embedding), item_matches in zip(ordered, matches):
+                    item_matches = item_matches[:item.request.limit]
+                    self.response_cache.put(embedding, item.request.limit, item_matches)
+                    self._resolve_matches(item, item_matches)
+
+            logger.debug("Served batch of %d searches (%d cache misses)", len(batch), len(misses))
+        except Exception as e:
+            logger.error("Batched RAG search failed: %s", e)
+            for item in batch:
+                if not item.future.done():
+                    item.future.set_exception(e)
+        except BaseException:
+            # Cancelled (e.g. at shutdown): cancel the callers' futures too so
+            # no request waits forever on a batch that will never finish
+            for item in batch:
+                if not item.future.done():
+                    item.future.cancel()
+            raise
+
+    def _resolve_matches(self, item: _PendingSearch, matches: Matches) -> None:
+        """
+        Complete a pending search from raw matches unless its caller has gone away.
+
+        Args:
+            item: Search to complete
+            matches: (document, similarity_score, metadata) tuples, cached or fresh
+        """
+        if not item.future.done():
+            item.future.set_result(
+                self.rag_engine.to_configuration_results(matches, item.request.wing_spec)
+            )
+
+
+# Global batching proxy instance
+_rag_proxy: Optional[BatchingRAGProxy] = None
+
+
+def get_rag_proxy(settings: Optional[Settings] = None) -> BatchingRAGProxy:
+    """
+    Get or initialize the global batching RAG proxy (singleton).
+
+    Args:
+        settings: Application settings (optional, uses get_settings() if None)
+
+    Returns:
+        BatchingRAGProxy: Proxy over the global RAG engine and response cache
+    """
+    global _rag_proxy
+    if _rag_proxy is None:
+        if settings is None:
+            settings = get_settings()
+        _rag_proxy = BatchingRAGProxy(
+            rag_engine=get_rag_engine(settings),
+            response_cache=get_response_cache(settings),
+            window_ms=settings.rag_batch_window_ms,
+            max_batch_size=settings.rag_batch_max_size
+        )
+    return _rag_proxy
+
+
+def reset_rag_proxy() -> None:
+    """Reset the global batching proxy (primarily for testing)."""
+    global _rag_proxy
+    _rag_proxy = None
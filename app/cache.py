@@ -0,0 +1,412 @@
+"""
+Caching layers for the RAG search path.
+
+This module handles:
+- Approximate (semantic) caching of similar-airfoil search matches
+- Exact caching of text embeddings, in memory and on disk
+
+Repeated and near-repeated wing specifications produce almost identical query
+embeddings. Rather than querying the vector database again, the semantic cache
+compares the new query embedding against recently answered queries and reuses
+their raw matches when the cosine distance is within a configured tolerance.
+Only the (document, similarity, metadata) matches are cached: performance
+estimates depend on the exact wing geometry, so callers build them per request.
+Searches that match nothing are not cached.
+
+Producing the query embedding is itself a network round-trip to the embeddings
+API. The embedding cache keys vectors by a hash of the embedding model and the
+exact text, so a repeated query text skips the API call entirely.
+"""
+import hashlib
+import logging
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+import numpy as np
+
+from app.core.config import Settings, get_settings
+from app.models import pack_embedding, unpack_embedding
+
+logger = logging.getLogger(__name__)
+
+# (document, similarity_score, metadata) tuples from a vector search
+Matches = list[tuple[str, float, dict]]
+
+
+class SemanticResponseCache:
+    """
+    Approximate LRU cache of similarity search matches keyed by query embedding.
+
+    Responsibilities:
+    - Store unit-normalized query embeddings in a preallocated matrix
+    - Find the nearest cached query with a single matrix-vector product
+    - Evict the least recently used entry when full
+
+    Entries only match queries that asked for the same result limit, so a
+    cached top-3 answer is never returned for a top-10 request.
+    """
+
+    def __init__(self, capacity: int, max_distance: float):
+        """
+        Initialize an empty cache.
+
+        Args:
+            capacity: Maximum number of cached queries (0 disables the cache)
+            max_distance: Largest cosine distance (1 - cosine similarity) at
+                which a cached query is considered a hit
+        """
+        self.capacity = capacity
+        self.max_distance = max_distance
+        self._lock = threading.Lock()
+        self._vectors: Optional[np.ndarray] = None
+        self._limits = np.zeros(capacity, dtype=np.int64)
+        self._valid = np.zeros(capacity, dtype=bool)
+        self._results: list[Optional[Matches]] = [None] * capacity
+        # Slot index -> None, ordered from least to most recently used
+        self._lru: OrderedDict[int, None] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """Number of cached queries."""
+        return len(self._lru)
+
+    @staticmethod
+    def _normalize(embedding) -> Optional[np.ndarray]:
+        """Return the embedding as a float32 unit vector, or None if it is zero."""
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = float(np.linalg.norm(vector))
+        if norm == 0.0:
+            return None
+        return vector / norm
+
+    def get(self, embedding, limit: int) -> Optional[Matches]:
+        """
+        Look up results for a query embedding.
+
+        Args:
+            embedding: Query embedding vector
+            limit: Result limit requested by the caller
+
+        Returns:
+            Cached matches of the nearest matching query, or None on a miss
+        """
+        if self.capacity == 0:
+            return None
+        query = self._normalize(embedding)
+
+        with self._lock:
+            if query is None or self._vectors is None or not self._lru:
+                self.misses += 1
+                return None
+            if query.shape[0] != self._vectors.shape[1]:
+                self.misses += 1
+                return None
+
+            similarities = self._vectors @ query
+            similarities[~(self._valid & (self._limits == limit))] = -np.inf
+            best = int(np.argmax(similarities))
+            if 1.0 - similarities[best] > self.max_distance:
+                self.misses += 1
+                return None
+
+            self._lru.move_to_end(best)
+            self.hits += 1
+            return self._results[best]
+
+    def put(
+        self,
+        embedding,
+        limit: int,
+        results: Matches
+    ) -> None:
+        """
+        Cache matches for a query embedding, evicting the LRU entry if full.
+
+        An empty match list is not cached. It usually means the collection
+        has not been loaded yet, and the data loader runs in another process,
+        so a cached empty answer would outlive the load.
+
+        Args:
+            embedding: Query embedding vector
+            limit: Result limit the matches were searched with
+            results: Raw search matches to reuse for nearby queries
+        """
+        if self.capacity == 0 or not results:
+            return
+        query = self._normalize(embedding)
+        if query is None:
+            return
+
+        with self._lock:
+            if self._vectors is None or self._vectors.shape[1] != query.shape[0]:
+                # First insert (or a change of embedding model): size the matrix
+                self._vectors = np.zeros((self.capacity, query.shape[0]), dtype=np.float32)
+                self._valid[:] = False
+                self._results = [None] * self.capacity
+                self._lru.clear()
+
+            if len(self._lru) < self.capacity:
+                slot = int(np.argmin(self._valid))
+            else:
+                slot, _ = self._lru.popitem(last=False)
+
+            self._vectors[slot] = query
+            self._limits[slot] = limit
+            self._valid[slot] = True
+            self._results[slot] = results
+            self._lru[slot] = None
+            self._lru.move_to_end(slot)
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        with self._lock:
+            self._valid[:] = False
+            self._results = [None] * self.capacity
+            self._lru.clear()
+        logger.info("Semantic response cache cleared")
+
+
+class EmbeddingCache:
+    """
+    LRU cache of text embeddings with optional SQLite persistence.
+    
+    Responsibilities:
+    - Key embeddings by sha256(model namespace + text)
+    - Keep recently used vectors in memory as float32 arrays
+    - Persist vectors as raw float32 blobs so they survive restarts and load
+      with a zero-copy unpack_embedding()
+    
+    The SQLite file is opened lazily on first use and only consulted on an
+    in-memory miss.
+    """
+
+    _SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS embeddings_cache "
+        "(key BLOB PRIMARY KEY, vec BLOB NOT NULL)"
+    )
+    # Let SQLite serve reads from a memory-mapped file instead of read() calls
+    _MMAP_SIZE_BYTES = 256 * 1024 * 1024
+
+    def __init__(self, capacity: int, path: Optional[Path] = None):
+        """
+        Initialize an empty cache.
+        
+        Args:
+            capacity: Maximum number of vectors kept in memory (0 disables
+                the cache, including persistence)
+            path: SQLite file for persistence (memory-only if None)
+        """
+        self.capacity = capacity
+        self.path = path
+        self._lock = threading.Lock()
+        self._memory: OrderedDict[bytes, np.ndarray] = OrderedDict()
+        self._db: Optional[sqlite3.Connection] = None
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """Number of vectors held in memory."""
+        return len(self._memory)
+
+    @staticmethod
+    def make_key(namespace: str, text: str) -> bytes:
+        """
+        Build the cache key for a text.
+        
+        Args:
+            namespace: Identifies the embedding space (provider, model, dims)
+            text: Exact text that was embedded
+            
+        Returns:
+            bytes: sha256 digest of the namespace and text
+        """
+        return hashlib.sha256(f"{namespace}\0{text}".encode("utf-8")).digest()
+
+    def _connection(self) -> Optional[sqlite3.Connection]:
+        """Open the persistence database on first use (caller holds the lock)."""
+        if self._db is None and self.path is not None:
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._db = sqlite3.connect(
+                    f"file:{self.path}?mode=rwc",
+                    uri=True,
+                    check_same_thread=False
+                )
+                self._db.execute(f"PRAGMA mmap_size={self._MMAP_SIZE_BYTES}")
+                self._db.execute("PRAGMA journal_mode=WAL")
+                self._db.execute(self._SCHEMA)
+                self._db.commit()
+            except sqlite3.Error as e:
+                logger.warning("Embedding cache persistence disabled (%s): %s", self.path, e)
+                self.path = None
+                self._db = None
+        return self._db
+
+    def _remember(self, key: bytes, vector: np.ndarray) -> None:
+        """Insert into the in-memory LRU (caller holds the lock)."""
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.capacity:
+            self._memory.popitem(last=False)
+
+    def get(self, key: bytes) -> Optional[np.ndarray]:
+        """
+        Look up an embedding.
+        
+        Args:
+            key: Key from make_key()
+            
+        Returns:
+            Read-only float32 vector, or None on a miss
+        """
+        if self.capacity == 0:
+            return None
+        with self._lock:
+            vector = self._memory.get(key)
+            if vector is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return vector
+
+            db = self._connection()
+            row = None
+            if db is not None:
+                row = db.execute(
+                    "SELECT vec FROM embeddings_cache WHERE key = ?", (key,)
+                ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+
+            vector = unpack_embedding(row[0])
+            self._remember(key, vector)
+            self.hits += 1
+            return vector
+
+    @property
+    def persistent(self) -> bool:
+        """Whether lookups and stores may touch the SQLite file."""
+        return self.capacity > 0 and self.path is not None
+
+    def put(self, key: bytes, embedding) -> None:
+        """
+        Store an embedding in memory and, if configured, on disk.
+        
+        Args:
+            key: Key from make_key()
+            embedding: Embedding vector
+        """
+        self.put_many([(key, embedding)])
+
+    def put_many(self, items: Iterable[tuple[bytes, Any]]) -> None:
+        """
+        Store several embeddings, writing them to disk in one transaction.
+        
+        Each commit waits for the write to reach the file, so a batch of
+        embeddings is inserted with a single executemany() and commit.
+        
+        Args:
+            items: (key, embedding) pairs, keys from make_key()
+        """
+        if self.capacity == 0:
+            return
+        rows = [(key, pack_embedding(embedding)) for key, embedding in items]
+        if not rows:
+            return
+        with self._lock:
+            for key, blob in rows:
+                self._remember(key, unpack_embedding(blob))
+            db = self._connection()
+            if db is not None:
+                db.executemany(
+                    "INSERT OR REPLACE INTO embeddings_cache (key, vec) VALUES (?, ?)",
+                    rows
+                )
+                db.commit()
+
+    def clear(self) -> None:
+        """Drop all cached embeddings, including persisted ones."""
+        with self._lock:
+            self._memory.clear()
+            db = self._connection()
+            if db is not None:
+                db.execute("DELETE FROM embeddings_cache")
+                db.commit()
+        logger.info("Embedding cache cleared")
+
+    def close(self) -> None:
+        """Close the persistence database, if open."""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+
+# Global response cache instance
+_response_cache: Optional[SemanticResponseCache] = None
+
+
+def get_response_cache(settings: Optional[Settings] = None) -> SemanticResponseCache:
+    """
+    Get or initialize the global semantic response cache (singleton).
+
+    Args:
+        settings: Application settings (optional, uses get_settings() if None)
+
+    Returns:
+        SemanticResponseCache: Initialized cache (capacity 0 when disabled)
+    """
+    global _response_cache
+    if _response_cache is None:
+        if settings is None:
+            settings = get_settings()
+        capacity = settings.rag_cache_capacity if settings.rag_cache_enabled else 0
+        _response_cache = SemanticResponseCache(
+            capacity=capacity,
+            max_distance=settings.rag_cache_max_distance
+        )
+    return _response_cache
+
+
+def reset_response_cache() -> None:
+    """Reset the global response cache (primarily for testing)."""
+    global _response_cache
+    _response_cache = None
+
+
+# Global embedding cache instance
+_embedding_cache: Optional[EmbeddingCache] = None
+
+
+def get_embedding_cache(settings: Optional[Settings] = None) -> EmbeddingCache:
+    """
+    Get or initialize the global embedding cache (singleton).
+    
+    Args:
+        settings: Application settings (optional, uses get_settings() if None)
+        
+    Returns:
+        EmbeddingCache: Initialized cache (capacity 0 when disabled)
+    """
+    global _embedding_cache
+    if _embedding_cache is None:
+        if settings is None:
+            settings = get_settings()
+        enabled = settings.embedding_cache_enabled
+        _embedding_cache = EmbeddingCache(
+            capacity=settings.embedding_cache_capacity if enabled else 0,
+            path=settings.embedding_cache_path if settings.embedding_cache_persist else None
+        )
+    return _embedding_cache
+
+
+def reset_embedding_cache() -> None:
+    """Reset the global embedding cache (primarily for testing)."""
+    global _embedding_cache
+    if _embedding_cache is not None:
+        _embedding_cache.close()
+    _embedding_cache = None
@@ -4,7 +4,7 @@ Follows 12-factor app principles with environment variable validation.
 """
 from functools import lru_cache
 from pathlib import Path
-from typing import Literal
+from typing import Literal, Optional
 
 from pydantic_settings import BaseSettings
 
@@ -25,18 +25,44 @@ class Settings(BaseSettings):
     app_title: str = "Wing Aerodynamic Analyzer"
     app_version: str = "0.1.0"
 
+    # CORS (debug mode allows all origins)
+    cors_enabled: bool = True
+    cors_allow_origins: list[str] = ["http://localhost:3000"]
+
+    # ASGI server tuning (used by `python main.py`)
+    app_backlog: int = 2048
+    app_limit_concurrency: Optional[int] = None
+
     # Embeddings Configuration
     embedding_provider: Literal["openai", "local"] = "openai"
     openai_api_key: str = ""
     embedding_model: str = "text-embedding-3-small"
     embedding_dimension: int = 1536
+    # Seed local embeddings from SHA-256 instead of XXH3 (slower; matches
+    # vectors produced before XXH3 seeding was introduced)
+    local_embed_deterministic_crypto: bool = False
+    # Concurrent embeddings requests per process (async client); also sizes
+    # the OpenAI connection pools
+    embedding_max_concurrency: int = 16
+    # Idle pooled connections to the embeddings API stay open this long, so
+    # bursts of requests skip the TCP/TLS handshake
+    openai_keepalive_expiry_s: float = 300.0
+    # Multiplex async embeddings requests over one HTTP/2 connection
+    # (needs the optional http2 extra)
+    openai_http2: bool = False
     
     # Note: text-embedding-3-small produces 1536 dimensions
     # If switching models, update this value accordingly
     # text-embedding-3-large = 3072, ada = 1536
 
     # Database / Vector Store
+    # "sqlite-vec" needs the optional sqlite-vec extra
+    vector_store: Literal["chroma", "sqlite-vec"] = "chroma"
     chroma_path: Path = Path("./data/chroma_db")
+    # Set to use a Chroma server instead of the embedded database at chroma_path
+    chroma_host: Optional[str] = None
+    chroma_port: int = 8000
+    sqlite_vec_path: Path = Path("./data/vectors.sqlite3")
     airfoil_data_path: Path = Path("./data/uiuc_airfoils.csv")
 
     # RAG Configuration
@@ -44,8 +70,26 @@ class Settings(BaseSettings):
     rag_similarity_threshold: float = 0.3
     rag_top_k_results: int = 5
 
+    # Semantic response cache for similar-airfoil searches
+    rag_cache_enabled: bool = True
+    rag_cache_capacity: int = 256
+    rag_cache_max_distance: float = 0.02
+
+    # Exact cache of query/document embeddings (memory LRU + SQLite file)
+    embedding_cache_enabled: bool = True
+    embedding_cache_capacity: int = 4096
+    embedding_cache_persist: bool = True
+    embedding_cache_path: Path = Path("./data/embedding_cache.sqlite3")
+
+    # Batching of concurrent similar-airfoil searches
+    rag_batch_window_ms: float = 5.0
+    rag_batch_max_size: int = 32
+
     # MCP Tools
     mcp_tools_enabled: bool = True
+    # Per-call execution_time_ms in tool outputs; request latency is always
+    # reported via the X-Process-Time header
+    mcp_tool_timing_enabled: bool = False
 
     # Logging
     log_level: str = "INFO"
@@ -57,13 +101,6 @@ class Settings(BaseSettings):
         env_file_encoding = "utf-8"
         case_sensitive = False
 
-    def __init__(self, **kwargs):
-        """Initialize settings and create required directories."""
-        super().__init__(**kwargs)
-        # Ensure data directory exists
-        self.chroma_path.parent.mkdir(parents=True, exist_ok=True)
-        self.log_file.parent.mkdir(parents=True, exist_ok=True)
-
 
 @lru_cache(maxsize=1)
 def get_settings() -> Settings:
@@ -77,3 +114,19 @@ def get_settings() -> Settings:
         Settings: Application settings validated and loaded from environment
     """
     return Settings()
+
+
+def ensure_runtime_dirs(settings: Settings) -> None:
+    """
+    Create the directories the application writes to.
+    
+    Kept out of Settings construction so building settings has no filesystem
+    side effects; call once at process startup (API lifespan, data loader).
+    
+    Args:
+        settings: Application settings providing the configured paths
+    """
+    settings.chroma_path.parent.mkdir(parents=True, exist_ok=True)
+    settings.sqlite_vec_path.parent.mkdir(parents=True, exist_ok=True)
+    settings.embedding_cache_path.parent.mkdir(parents=True, exist_ok=True)
+    settings.log_file.parent.mkdir(parents=True, exist_ok=True)
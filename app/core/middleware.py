@@ -0,0 +1,49 @@
+"""
+ASGI middleware shared across the API.
+
+Implemented as plain ASGI callables rather than Starlette's BaseHTTPMiddleware,
+which wraps every request in an extra task and memory stream.
+"""
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+PROCESS_TIME_HEADER = b"x-process-time"
+
+
+class ProcessTimeMiddleware:
+    """
+    Report request handling time in an ``X-Process-Time`` response header.
+
+    Timing is taken once per HTTP request with ``perf_counter_ns`` and written
+    in milliseconds when the response headers are sent, which covers routing,
+    validation and handler execution for every endpoint.
+    """
+
+    def __init__(self, app: ASGIApp):
+        """
+        Wrap an ASGI application.
+
+        Args:
+            app: Downstream ASGI application
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Time HTTP requests; pass other scope types straight through."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_ns = time.perf_counter_ns()
+
+        async def send_with_process_time(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                elapsed_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+                message["headers"] = [
+                    *message.get("headers", []),
+                    (PROCESS_TIME_HEADER, f"{elapsed_ms:.3f}".encode("latin-1")),
+                ]
+            await send(message)
+
+        await self.app(scope, receive, send_with_process_time)
@@ -0,0 +1,27 @@
+"""
+Response classes shared across the API.
+
+Starlette's default JSONResponse encodes with the stdlib ``json`` module in
+Python. OrjsonResponse renders with orjson's C serializer, which emits bytes
+directly and is several times faster for the nested dicts the API returns.
+"""
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class OrjsonResponse(JSONResponse):
+    """
+    JSON response rendered with orjson.
+    
+    Defined locally rather than using ``fastapi.responses.ORJSONResponse``,
+    which is deprecated in recent FastAPI releases.
+    """
+
+    def render(self, content: Any) -> bytes:
+        """Serialize content to JSON bytes."""
+        return orjson.dumps(
+            content,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        )
@@ -12,54 +12,64 @@ These tools are exposed via:
 1. Direct API endpoints (POST /api/v1/tools/{tool_name})
 2. Through Claude as MCP tools for agentic workflows
 """
+import asyncio
+import functools
+import inspect
 import logging
 import time
 from abc import ABC, abstractmethod
-from typing import Any, Callable, Optional
+from typing import Any, Awaitable, Callable, ClassVar, Optional, cast
 
-from app.models import DownforceEstimateInput, ToolOutput
+from app.core.config import Settings, get_settings
+from app.models import DownforceEstimateInput, FlowInfluenceInput, ToolInput, ToolOutput
 
 logger = logging.getLogger(__name__)
 
 
 class MCPTool(ABC):
     """
-    Abstract base class for MCP tool implementations.
+    Base class for MCP tool implementations.
     
     All MCP tools must implement this interface to ensure:
     - Consistent input/output formats
     - Proper error handling
     - Tool metadata for schema generation
+    
+    Tool metadata is declared as plain class attributes (no property
+    descriptors), so catalog reads are ordinary attribute lookups; only
+    execute() is abstract:
+    
+        name: Unique tool identifier
+        description: Human-readable description of what the tool does
+        input_model: Pydantic model describing the tool inputs; the API layer
+            validates request bodies against it before calling execute()
+        input_schema: JSON schema for the inputs, generated once from
+            input_model when the subclass is defined
     """
 
-    @property
-    @abstractmethod
-    def name(self) -> str:
-        """Unique tool identifier."""
-        pass
+    # Tools carry no per-instance state; ABC declares empty slots too, so
+    # instances still get no __dict__
+    __slots__ = ()
 
-    @property
-    @abstractmethod
-    def description(self) -> str:
-        """Human-readable description of what the tool does."""
-        pass
+    name: ClassVar[str]
+    description: ClassVar[str]
+    input_model: ClassVar[type[ToolInput]]
+    input_schema: ClassVar[dict]
 
-    @property
-    @abstractmethod
-    def input_schema(self) -> dict:
-        """
-        JSON schema for tool input validation.
-        
-        Returns:
-            dict: Pydantic schema for input parameters
-        """
-        pass
+    def __init_subclass__(cls, **kwargs):
+        """Build the input JSON schema once per tool class."""
+        super().__init_subclass__(**kwargs)
+        if "input_model" in cls.__dict__ and "input_schema" not in cls.__dict__:
+            cls.input_schema = cls.input_model.model_json_schema()
 
     @abstractmethod
     async def execute(self, **kwargs) -> dict:
         """
         Execute the tool with provided arguments.
         
+        Subclasses may implement this as a plain ``def`` when the work is
+        blocking; the registry then runs it in a worker thread.
+        
         Args:
             **kwargs: Tool-specific input parameters
             
@@ -87,29 +97,15 @@ class DownforceEstimatorTool(MCPTool):
     4. Return estimate with confidence bounds
     """
 
-    @property
-    def name(self) -> str:
-        """Tool identifier."""
-        return "estimate_downforce"
-
-    @property
-    def description(self) -> str:
-        """Tool description."""
-        return (
-            "Estimate downforce production for a wing configuration. "
-            "Takes airfoil name, speed, and geometry, returns expected downforce. "
-            "Uses aerodynamic coefficients from reference database."
-        )
+    __slots__ = ()
 
-    @property
-    def input_schema(self) -> dict:
-        """
-        Input schema for downforce estimation.
-        
-        Returns:
-            dict: Pydantic schema
-        """
-        return DownforceEstimateInput.model_json_schema()
+    name = "estimate_downforce"
+    description = (
+        "Estimate downforce production for a wing configuration. "
+        "Takes airfoil name, speed, and geometry, returns expected downforce. "
+        "Uses aerodynamic coefficients from reference database."
+    )
+    input_model = DownforceEstimateInput
 
     async def execute(self, **kwargs) -> dict:
         """
@@ -126,20 +122,56 @@ class DownforceEstimatorTool(MCPTool):
             
         Implementation placeholder - to be filled in development
         """
-        logger.info(f"Executing downforce estimation: {kwargs}")
+        logger.info("Executing downforce estimation: %s", kwargs)
         
-        # Placeholder implementation
-        # In Week 1 development, this will:
-        # 1. Query aerodynamic database for airfoil
-        # 2. Interpolate coefficients
-        # 3. Calculate lift/downforce using: L = 0.5 * rho * v^2 * S * CL
+        # Near-identical configurations give effectively the same estimate,
+        # so inputs are bucketed before the memoized lookup. Return a copy so
+        # callers cannot mutate the cached result.
+        estimate = _estimate_downforce(
+            kwargs["airfoil"],
+            _round_to(kwargs["speed_kph"], DOWNFORCE_SPEED_STEP_KPH),
+            _round_to(kwargs["chord_mm"], DOWNFORCE_LENGTH_STEP_MM),
+            _round_to(kwargs["span_mm"], DOWNFORCE_LENGTH_STEP_MM),
+        )
+        return dict(estimate)
+
+
+# Bucket sizes for memoized downforce estimates
+DOWNFORCE_SPEED_STEP_KPH = 5
+DOWNFORCE_LENGTH_STEP_MM = 10
+
+
+def _round_to(value: float, step: float) -> float:
+    """Round value to the nearest multiple of step."""
+    return round(value / step) * step
+
+
+@functools.lru_cache(maxsize=4096)
+def _estimate_downforce(airfoil: str, speed_kph: float, chord_mm: float, span_mm: float) -> dict:
+    """
+    Compute a downforce estimate for bucketed inputs (memoized).
+    
+    Args:
+        airfoil: Airfoil designation
+        speed_kph: Operating speed, rounded to DOWNFORCE_SPEED_STEP_KPH
+        chord_mm: Chord length, rounded to DOWNFORCE_LENGTH_STEP_MM
+        span_mm: Span length, rounded to DOWNFORCE_LENGTH_STEP_MM
         
-        return {
-            "airfoil": kwargs.get("airfoil"),
-            "estimated_downforce_kg": 45.2,
-            "confidence_percent": 85.0,
-            "calculation_method": "database_lookup"
-        }
+    Returns:
+        dict: Estimated downforce and characteristics
+    """
+    # Placeholder implementation
+    # In Week 1 development, this will:
+    # 1. Query aerodynamic database for airfoil
+    # 2. Interpolate coefficients
+    # 3. Calculate lift/downforce using: L = 0.5 * rho * v^2 * S * CL
+    
+    return {
+        "airfoil": airfoil,
+        "estimated_downforce_kg": 45.2,
+        "confidence_percent": 85.0,
+        "calculation_method": "database_lookup"
+    }
 
 
 class FlowInfluencePredictorTool(MCPTool):
@@ -154,39 +186,15 @@ class FlowInfluencePredictorTool(MCPTool):
     Uses empirical models based on wing geometry and operating conditions.
     """
 
-    @property
-    def name(self) -> str:
-        """Tool identifier."""
-        return "predict_flow_influence"
-
-    @property
-    def description(self) -> str:
-        """Tool description."""
-        return (
-            "Predict downstream flow effects from a wing configuration. "
-            "Returns wake deficit, vortex characteristics, and impact on "
-            "downstream elements like splitter and diffuser."
-        )
+    __slots__ = ()
 
-    @property
-    def input_schema(self) -> dict:
-        """
-        Input schema for flow influence prediction.
-        
-        Returns:
-            dict: Pydantic schema describing required inputs
-        """
-        # Placeholder - to be defined in development
-        return {
-            "type": "object",
-            "properties": {
-                "wing_chord_mm": {"type": "number"},
-                "wing_span_mm": {"type": "number"},
-                "downstream_distance_mm": {"type": "number"},
-                "geometry": {"type": "string"}
-            },
-            "required": ["wing_chord_mm", "wing_span_mm"]
-        }
+    name = "predict_flow_influence"
+    description = (
+        "Predict downstream flow effects from a wing configuration. "
+        "Returns wake deficit, vortex characteristics, and impact on "
+        "downstream elements like splitter and diffuser."
+    )
+    input_model = FlowInfluenceInput
 
     async def execute(self, **kwargs) -> dict:
         """
@@ -197,7 +205,7 @@ class FlowInfluencePredictorTool(MCPTool):
             
         Implementation placeholder - to be filled in development
         """
-        logger.info(f"Executing flow influence prediction: {kwargs}")
+        logger.info("Executing flow influence prediction: %s", kwargs)
         
         # Placeholder implementation
         # In development, this will use empirical models or lookup tables
@@ -223,9 +231,22 @@ class MCPToolRegistry:
     Design pattern: Registry pattern
     """
 
-    def __init__(self):
-        """Initialize tool registry with default tools."""
+    __slots__ = ("_tools", "_execute_map", "_catalog_cache", "_time_execution")
+
+    def __init__(self, time_execution: bool = False):
+        """
+        Initialize tool registry with default tools.
+        
+        Args:
+            time_execution: Record execution_time_ms on each ToolOutput.
+                Request latency is otherwise reported by ProcessTimeMiddleware.
+        """
+        self._time_execution = time_execution
         self._tools: dict[str, MCPTool] = {}
+        # Tool name -> awaitable execute callable, so dispatch is a single
+        # dict lookup instead of get_tool() plus attribute access
+        self._execute_map: dict[str, Callable[..., Awaitable[dict]]] = {}
+        self._catalog_cache: Optional[list[dict]] = None
         self._register_default_tools()
         logger.info("MCP Tool Registry initialized")
 
@@ -247,7 +268,15 @@ class MCPToolRegistry:
         if tool.name in self._tools:
             raise ValueError(f"Tool '{tool.name}' already registered")
         self._tools[tool.name] = tool
-        logger.debug(f"Registered tool: {tool.name}")
+        if inspect.iscoroutinefunction(tool.execute):
+            self._execute_map[tool.name] = tool.execute
+        else:
+            # Synchronous tools run in a worker thread so a blocking
+            # implementation cannot stall the event loop
+            execute = cast(Callable[..., dict], tool.execute)
+            self._execute_map[tool.name] = functools.partial(asyncio.to_thread, execute)
+        self._catalog_cache = None
+        logger.debug("Registered tool: %s", tool.name)
 
     def get_tool(self, name: str) -> Optional[MCPTool]:
         """
@@ -261,12 +290,24 @@ class MCPToolRegistry:
         """
         return self._tools.get(name)
 
+    def get_tools(self) -> list[MCPTool]:
+        """
+        Get all registered tools.
+        
+        Returns:
+            list[MCPTool]: Registered tool instances in registration order
+        """
+        return list(self._tools.values())
+
     def list_tools(self) -> list[dict]:
         """
         List all available tools with schemas.
         
+        The catalog only changes when a tool is registered, so it is built
+        once and reused until the next call to register().
+        
         Returns:
-            list[dict]: Tool metadata for client discovery
+            list[dict]: Tool metadata for client discovery (shared; do not mutate)
             
         Example:
             >>> registry.list_tools()
@@ -279,14 +320,16 @@ class MCPToolRegistry:
                 ...
             ]
         """
-        return [
-            {
-                "name": tool.name,
-                "description": tool.description,
-                "input_schema": tool.input_schema
-            }
-            for tool in self._tools.values()
-        ]
+        if self._catalog_cache is None:
+            self._catalog_cache = [
+                {
+                    "name": tool.name,
+                    "description": tool.description,
+                    "input_schema": tool.input_schema
+                }
+                for tool in self._tools.values()
+            ]
+        return self._catalog_cache
 
     async def execute_tool(self, tool_name: str, **kwargs) -> ToolOutput:
         """
@@ -302,48 +345,57 @@ class MCPToolRegistry:
         Raises:
             ValueError: If tool not found or input invalid
         """
-        tool = self.get_tool(tool_name)
-        if tool is None:
+        execute = self._execute_map.get(tool_name)
+        if execute is None:
             raise ValueError(f"Tool '{tool_name}' not found")
 
-        start_time = time.time()
+        start_ns = time.perf_counter_ns() if self._time_execution else 0
         try:
-            result = await tool.execute(**kwargs)
-            execution_time_ms = (time.time() - start_time) * 1000
-            
-            logger.info(f"Tool '{tool_name}' executed successfully")
-            return ToolOutput(
-                tool_name=tool_name,
-                success=True,
-                result=result,
-                execution_time_ms=execution_time_ms
-            )
+            result = await execute(**kwargs)
         except Exception as e:
-            execution_time_ms = (time.time() - start_time) * 1000
-            logger.error(f"Tool '{tool_name}' failed: {e}")
+            logger.error("Tool '%s' failed: %s", tool_name, e)
             return ToolOutput(
                 tool_name=tool_name,
                 success=False,
                 result=None,
                 error_message=str(e),
-                execution_time_ms=execution_time_ms
+                execution_time_ms=self._elapsed_ms(start_ns)
             )
 
+        logger.info("Tool '%s' executed successfully", tool_name)
+        return ToolOutput(
+            tool_name=tool_name,
+            success=True,
+            result=result,
+            execution_time_ms=self._elapsed_ms(start_ns)
+        )
+
+    def _elapsed_ms(self, start_ns: int) -> Optional[float]:
+        """Milliseconds since start_ns, or None when timing is disabled."""
+        if not self._time_execution:
+            return None
+        return (time.perf_counter_ns() - start_ns) / 1_000_000
+
 
 # Global tool registry instance
 _tool_registry: Optional[MCPToolRegistry] = None
 
 
-def get_tool_registry() -> MCPToolRegistry:
+def get_tool_registry(settings: Optional[Settings] = None) -> MCPToolRegistry:
     """
     Get or initialize the global MCP tool registry (singleton).
     
+    Args:
+        settings: Application settings (optional, uses get_settings() if None)
+        
     Returns:
         MCPToolRegistry: Initialized registry
     """
     global _tool_registry
     if _tool_registry is None:
-        _tool_registry = MCPToolRegistry()
+        if settings is None:
+            settings = get_settings()
+        _tool_registry = MCPToolRegistry(time_execution=settings.mcp_tool_timing_enabled)
     return _tool_registry
 
 
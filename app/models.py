@@ -3,13 +3,63 @@ Pydantic models for request/response validation.
 
 These models define the contract for all API endpoints and internal communication.
 They provide automatic validation, documentation, and type safety.
+
+ToolOutput is the exception: it is built internally once per tool call and
+never validated from user input, so it is a msgspec Struct that encodes
+straight to JSON bytes without a Pydantic dump.
+
+Embedding vectors are never carried as ``list[float]``: a 1536-element list
+costs a float object and a validator call per element. pack_embedding() and
+unpack_embedding() convert vectors to and from the raw float32 bytes used by
+the caches and vector stores.
 """
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
 from typing import Optional
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, Field, field_validator
+import msgspec
+import numpy as np
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+
+
+# Bucket sizes for WingSpecification.to_query_text(). Specs that differ by
+# less than a bucket produce the same query text, and so share an embedding
+# cache entry and retrieved matches; performance is still estimated from the
+# exact geometry.
+QUERY_LENGTH_STEP_MM = 10
+QUERY_SPEED_STEP_KPH = 5
+
+
+def pack_embedding(embedding) -> bytes:
+    """
+    Pack an embedding vector as raw float32 bytes.
+    
+    Args:
+        embedding: Embedding vector (array or sequence of floats)
+        
+    Returns:
+        bytes: Little-endian float32 vector (4 bytes per dimension)
+    """
+    return np.asarray(embedding, dtype="<f4").tobytes()
+
+
+def unpack_embedding(blob: bytes) -> np.ndarray:
+    """
+    View packed embedding bytes as a float32 vector without copying.
+    
+    Args:
+        blob: Bytes from pack_embedding()
+        
+    Returns:
+        np.ndarray: Read-only float32 vector backed by blob
+    """
+    return np.frombuffer(blob, dtype="<f4")
+
+
+def _utc_now() -> datetime:
+    """Current time as a timezone-aware UTC datetime."""
+    return datetime.now(timezone.utc)
 
 
 class WingType(str, Enum):
@@ -73,13 +123,28 @@ class WingSpecification(BaseModel):
         description="Operating speed (kph), must be 10-400kph"
     )
 
-    @field_validator("chord_mm", "span_mm", "target_downforce_kg", "operating_speed_kph")
-    @classmethod
-    def validate_positive(cls, v):
-        """Ensure all numeric fields are positive."""
-        if v <= 0:
-            raise ValueError("Value must be positive")
-        return v
+    def to_query_text(self) -> str:
+        """
+        Describe the specification as a search query for the knowledge base.
+        
+        Chord and span are bucketed to QUERY_LENGTH_STEP_MM, speed to
+        QUERY_SPEED_STEP_KPH and downforce to whole kilograms, so nearly
+        identical specs map to one query text (and one cached embedding).
+        The bucketing only affects retrieval: results estimate performance
+        from this spec's exact values.
+        
+        Returns:
+            str: Natural-language query text
+        """
+        chord = round(self.chord_mm / QUERY_LENGTH_STEP_MM) * QUERY_LENGTH_STEP_MM
+        span = round(self.span_mm / QUERY_LENGTH_STEP_MM) * QUERY_LENGTH_STEP_MM
+        speed = round(self.operating_speed_kph / QUERY_SPEED_STEP_KPH) * QUERY_SPEED_STEP_KPH
+        return (
+            f"{self.wing_type.value.replace('_', ' ')} wing with "
+            f"{chord}mm chord and {span}mm span, "
+            f"targeting {round(self.target_downforce_kg)}kg downforce "
+            f"at {speed}kph"
+        )
 
 
 class AeroPerformanceEstimate(BaseModel):
@@ -92,6 +157,8 @@ class AeroPerformanceEstimate(BaseModel):
         drag_coefficient: Estimated drag coefficient
         efficiency_ratio: Downforce to drag ratio (higher is better)
     """
+    model_config = ConfigDict(frozen=True)
+
     downforce_kg: float = Field(..., description="Estimated downforce")
     downforce_variance_percent: float = Field(..., description="Uncertainty margin")
     drag_coefficient: float = Field(..., description="Estimated drag coefficient")
@@ -109,12 +176,48 @@ class SimilarConfigurationResult(BaseModel):
         performance: Associated performance metrics
         source: Where this data comes from (database, literature, etc.)
     """
+    model_config = ConfigDict(frozen=True)
+
     rank: int = Field(..., description="Result ranking")
     airfoil_name: str = Field(..., description="Matched airfoil name")
     similarity_score: float = Field(..., ge=0, le=1, description="Similarity metric 0-1")
     performance: AeroPerformanceEstimate
     source: str = Field(..., description="Data source")
 
+    @classmethod
+    def from_rag(
+        cls,
+        rank: int,
+        similarity_score: float,
+        metadata: dict,
+        performance: AeroPerformanceEstimate,
+        default_source: str
+    ) -> "SimilarConfigurationResult":
+        """
+        Build a result from a RAG search match without re-validating it.
+        
+        The values come from RAGEngine rather than a client, so they are
+        assigned with model_construct(); callers clamp similarity_score to
+        0-1 themselves.
+        
+        Args:
+            rank: Position in results (1-based)
+            similarity_score: Similarity of the match, already within 0-1
+            metadata: Stored airfoil metadata of the match
+            performance: Estimate for the requested wing
+            default_source: Source reported when the metadata has none
+            
+        Returns:
+            SimilarConfigurationResult: Unvalidated result instance
+        """
+        return cls.model_construct(
+            rank=rank,
+            airfoil_name=str(metadata.get("airfoil_name", metadata.get("name", "unknown"))),
+            similarity_score=similarity_score,
+            performance=performance,
+            source=str(metadata.get("source", default_source))
+        )
+
 
 class OptimizationResponse(BaseModel):
     """
@@ -129,6 +232,8 @@ class OptimizationResponse(BaseModel):
         reasoning: Explanation of optimization approach
         timestamp: When optimization was completed
     """
+    model_config = ConfigDict(frozen=True)
+
     job_id: UUID = Field(default_factory=uuid4, description="Unique job identifier")
     status: str = Field(..., description="Processing status")
     recommended_airfoil: AirfoilProfile
@@ -138,7 +243,7 @@ class OptimizationResponse(BaseModel):
         description="Reference configurations from database"
     )
     reasoning: str = Field(..., description="Explanation of recommendations")
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=_utc_now)
 
 
 class ToolInput(BaseModel):
@@ -166,22 +271,44 @@ class DownforceEstimateInput(ToolInput):
     span_mm: float = Field(..., gt=0, description="Span length")
 
 
-class ToolOutput(BaseModel):
+class FlowInfluenceInput(ToolInput):
+    """
+    Input for flow influence prediction MCP tool.
+    
+    Attributes:
+        wing_chord_mm: Upstream wing chord length
+        wing_span_mm: Upstream wing span length
+        downstream_distance_mm: Distance to the downstream component
+        geometry: Downstream component geometry (e.g., "splitter", "diffuser")
+    """
+    wing_chord_mm: float = Field(..., gt=0, description="Wing chord length")
+    wing_span_mm: float = Field(..., gt=0, description="Wing span length")
+    downstream_distance_mm: Optional[float] = Field(
+        None, gt=0, description="Distance to downstream component"
+    )
+    geometry: Optional[str] = Field(None, description="Downstream component geometry")
+
+
+class ToolOutput(msgspec.Struct, frozen=True, gc=False):
     """
     Output response from MCP tool execution.
     
+    Immutable and excluded from garbage-collector tracking: tool results are
+    plain JSON data that never reference the output, so no cycles can form.
+    
     Attributes:
         tool_name: Name of the tool that was executed
         success: Whether execution succeeded
         result: The computed result
         error_message: Error description if execution failed
-        execution_time_ms: Time taken to execute (milliseconds)
+        execution_time_ms: Time taken to execute (milliseconds), only set
+            when per-tool timing is enabled
     """
     tool_name: str
     success: bool
     result: Optional[dict] = None
     error_message: Optional[str] = None
-    execution_time_ms: float
+    execution_time_ms: Optional[float] = None
 
 
 class SimilarAirfoilRequest(BaseModel):
@@ -205,6 +332,13 @@ class SimilarAirfoilResponse(BaseModel):
         results: List of similar airfoils with relevance scores
         search_time_ms: Time taken for search
     """
+    model_config = ConfigDict(frozen=True)
+
     query_spec: WingSpecification
     results: list[SimilarConfigurationResult]
     search_time_ms: float
+
+
+# Response serializers, built once at import and reused by the route handlers
+OPTIMIZATION_RESPONSE_ADAPTER = TypeAdapter(OptimizationResponse)
+SIMILAR_AIRFOIL_RESPONSE_ADAPTER = TypeAdapter(SimilarAirfoilResponse)
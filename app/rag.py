@@ -12,19 +12,112 @@ The RAG pipeline allows us to:
 2. Store vectors in Chroma vector database
 3. Retrieve similar designs when given a new wing specification
 4. Provide context-aware recommendations to the LLM
+
+chromadb and openai each take hundreds of milliseconds to import, so they
+are imported where first used: chromadb when the Chroma client opens, openai
+when an OpenAI-backed engine is created.
 """
+import asyncio
+import hashlib
 import logging
 import time
-from typing import Optional
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, Any, Optional, cast
 
-import chromadb
-from openai import OpenAI
+import numpy as np
+import xxhash
 
+from app.cache import EmbeddingCache, get_embedding_cache
 from app.core.config import Settings, get_settings
-from app.models import AeroPerformanceEstimate, SimilarConfigurationResult
+from app.models import (
+    AeroPerformanceEstimate,
+    SimilarConfigurationResult,
+    WingSpecification,
+)
+from app.vector_store import SqliteVecCollection
+
+if TYPE_CHECKING:
+    import httpx
+    from chromadb.api import ClientAPI
+    from chromadb.api.collection_configuration import CreateHNSWConfiguration
+    from openai import AsyncOpenAI, OpenAI
 
 logger = logging.getLogger(__name__)
 
+# Physical constants for performance estimates (sea-level ISA)
+AIR_DENSITY_KG_M3 = 1.225
+GRAVITY_M_S2 = 9.81
+DEFAULT_RESULT_SOURCE = "UIUC airfoil database"
+
+# OpenAI embeddings request limits: inputs per request and total tokens per
+# request. Tokens are estimated at ~4 characters each, which is conservative
+# for the short English descriptions stored here.
+EMBEDDING_MAX_BATCH_INPUTS = 2048
+EMBEDDING_MAX_BATCH_TOKENS = 300_000
+CHARS_PER_TOKEN_ESTIMATE = 4
+
+# Identify the _local_embed seeding in embedding cache keys; change them
+# whenever local embeddings would come out differently for the same text
+LOCAL_EMBEDDING_SCHEME = "xxh3-pcg64"
+LOCAL_EMBEDDING_SCHEME_CRYPTO = "sha256-pcg64"
+
+# Per-request limits for embeddings API calls (seconds); the SDK retries on timeout
+OPENAI_TIMEOUT_S = 60.0
+OPENAI_CONNECT_TIMEOUT_S = 5.0
+
+# Records per vector store upsert during bulk loads. Writes are batched
+# separately from embeddings requests, so several embedded batches can share
+# one upsert (one transaction and index update).
+VECTOR_STORE_WRITE_BATCH_SIZE = 1024
+
+# HNSW index for new Chroma collections. Cosine space matches the
+# 1 - distance similarity computed in search_by_embeddings; the catalog is
+# small and bulk-loaded, so fewer graph links with a wider build-time search
+# keep the index small without hurting recall.
+CHROMA_HNSW_CONFIGURATION: "CreateHNSWConfiguration" = {
+    "space": "cosine",
+    "max_neighbors": 8,
+    "ef_construction": 200
+}
+
+# (airfoil_name, description, metadata, document_id) as taken by add_airfoil
+AirfoilRecord = tuple[str, str, dict, str]
+
+
+def estimate_performance(
+    metadata: dict,
+    wing_spec: WingSpecification,
+    similarity: float
+) -> AeroPerformanceEstimate:
+    """
+    Estimate performance of a stored airfoil at the requested geometry and speed.
+    
+    Uses the thin-wing lift equation L = 0.5 * rho * v^2 * S * CL with the
+    airfoil's maximum lift coefficient, so the estimate is an upper bound.
+    
+    Args:
+        metadata: Stored airfoil metadata (expects max_cl and max_cd)
+        wing_spec: Requested wing geometry and operating speed
+        similarity: Similarity score of the match (drives the variance)
+        
+    Returns:
+        AeroPerformanceEstimate: Estimated downforce and drag characteristics
+    """
+    max_cl = float(metadata.get("max_cl", 0.0))
+    max_cd = float(metadata.get("max_cd", 0.0))
+    
+    speed_m_s = wing_spec.operating_speed_kph / 3.6
+    area_m2 = (wing_spec.chord_mm / 1000) * (wing_spec.span_mm / 1000)
+    downforce_n = 0.5 * AIR_DENSITY_KG_M3 * speed_m_s ** 2 * area_m2 * max_cl
+    
+    # Computed from stored floats, so skip model validation
+    return AeroPerformanceEstimate.model_construct(
+        downforce_kg=round(downforce_n / GRAVITY_M_S2, 2),
+        downforce_variance_percent=round((1 - similarity) * 100, 1),
+        drag_coefficient=max_cd,
+        efficiency_ratio=round(max_cl / max_cd, 2) if max_cd > 0 else 0.0
+    )
+
 
 class RAGEngine:
     """
@@ -39,17 +132,34 @@ class RAGEngine:
     Design pattern: Singleton pattern with dependency injection
     """
 
-    def __init__(self, settings: Settings):
+    def __init__(self, settings: Settings, embedding_cache: Optional[EmbeddingCache] = None):
         """
         Initialize RAG engine with settings and OpenAI client.
         
         Args:
             settings: Application settings containing API keys and config
+            embedding_cache: Cache consulted before embedding a text
+                (uses the global embedding cache if None)
             
         Raises:
             ValueError: If OPENAI_API_KEY is not configured
+            RuntimeError: If OPENAI_HTTP2 is set without the h2 package
         """
         self.settings = settings
+        self.embedding_cache = (
+            embedding_cache if embedding_cache is not None else get_embedding_cache(settings)
+        )
+        # Cached vectors are only valid for the embedding space they came from
+        if settings.embedding_provider == "local":
+            model = (
+                LOCAL_EMBEDDING_SCHEME_CRYPTO if settings.local_embed_deterministic_crypto
+                else LOCAL_EMBEDDING_SCHEME
+            )
+        else:
+            model = settings.embedding_model
+        self._embedding_namespace = (
+            f"{settings.embedding_provider}:{model}:{settings.embedding_dimension}"
+        )
         
         if settings.embedding_provider == "openai":
             if not settings.openai_api_key:
@@ -57,89 +167,333 @@ class RAGEngine:
                     "OPENAI_API_KEY must be configured when using OpenAI embeddings. "
                     "Set it in .env file or switch to EMBEDDING_PROVIDER=local."
                 )
-            self.client = OpenAI(api_key=settings.openai_api_key)
+            from openai import AsyncOpenAI, OpenAI
+
+            http_client, async_http_client = _openai_http_clients(settings)
+            # httpx clients are accepted by every SDK release; newer stubs only
+            # name the httpx2 fork
+            self.client: Optional["OpenAI"] = OpenAI(
+                api_key=settings.openai_api_key,
+                http_client=http_client  # type: ignore[arg-type]
+            )
+            self.aclient: Optional["AsyncOpenAI"] = AsyncOpenAI(
+                api_key=settings.openai_api_key,
+                http_client=async_http_client  # type: ignore[arg-type]
+            )
         else:
             self.client = None
-        self._chroma_client: Optional[chromadb.Client] = None
-        self._collection = None
+            self.aclient = None
+        # Created on first async use so it binds to the serving event loop
+        self._embed_semaphore: Optional[asyncio.Semaphore] = None
+        self._chroma_client: Optional["ClientAPI"] = None
+        self._collection: Any = None
         logger.info("RAG Engine initialized")
 
     @property
-    def chroma_client(self) -> chromadb.Client:
+    def chroma_client(self) -> "ClientAPI":
         """
         Lazy-load Chroma client.
         
+        Connects to a Chroma server when CHROMA_HOST is set, so the index and
+        its memory live in that process and API workers stay stateless.
+        Otherwise opens an embedded persistent database at CHROMA_PATH.
+        Anonymized telemetry is turned off for both.
+        
         Returns:
-            chromadb.Client: Initialized Chroma client
+            ClientAPI: Initialized Chroma client
         """
         if self._chroma_client is None:
-            self._chroma_client = chromadb.PersistentClient(
-                path=str(self.settings.chroma_path)
-            )
-            logger.debug(f"Chroma client initialized at {self.settings.chroma_path}")
+            import chromadb
+            from chromadb.config import Settings as ChromaSettings
+
+            chroma_settings = ChromaSettings(anonymized_telemetry=False)
+            if self.settings.chroma_host:
+                self._chroma_client = chromadb.HttpClient(
+                    host=self.settings.chroma_host,
+                    port=self.settings.chroma_port,
+                    settings=chroma_settings
+                )
+                logger.debug(f"Chroma client connected to "
+                             f"{self.settings.chroma_host}:{self.settings.chroma_port}")
+            else:
+                self._chroma_client = chromadb.PersistentClient(
+                    path=str(self.settings.chroma_path),
+                    settings=chroma_settings
+                )
+                logger.debug(f"Chroma client initialized at {self.settings.chroma_path}")
         return self._chroma_client
 
+    def check_vector_store(self) -> None:
+        """
+        Verify that a remote Chroma server is reachable.
+        
+        No-op for the embedded and sqlite-vec stores, which open lazily.
+        
+        Raises:
+            Exception: If the server does not answer its heartbeat
+        """
+        if self.settings.vector_store == "chroma" and self.settings.chroma_host:
+            self.chroma_client.heartbeat()
+
     @property
-    def collection(self):
+    def collection(self) -> Any:
         """
         Get or create the aerodynamic data collection.
         
         Returns:
             chromadb.Collection: The collection for storing aerodynamic data
+            (a SqliteVecCollection when VECTOR_STORE=sqlite-vec)
+            
+        Chroma collections are created with CHROMA_HNSW_CONFIGURATION; an
+        existing collection keeps the index settings it was created with
+        until it is cleared.
         """
         if self._collection is None:
-            self._collection = self.chroma_client.get_or_create_collection(
-                name=self.settings.rag_collection_name,
-                metadata={
-                    "description": "Wing aerodynamic design reference collection",
-                    "embedding_model": self.settings.embedding_model
-                }
-            )
+            if self.settings.vector_store == "sqlite-vec":
+                self._collection = SqliteVecCollection(
+                    path=self.settings.sqlite_vec_path,
+                    name=self.settings.rag_collection_name,
+                    dimension=self.settings.embedding_dimension
+                )
+            else:
+                self._collection = self.chroma_client.get_or_create_collection(
+                    name=self.settings.rag_collection_name,
+                    metadata={
+                        "description": "Wing aerodynamic design reference collection",
+                        "embedding_model": self.settings.embedding_model
+                    },
+                    configuration={"hnsw": CHROMA_HNSW_CONFIGURATION}
+                )
             logger.debug(f"Collection '{self.settings.rag_collection_name}' retrieved/created")
         return self._collection
 
-    def embed_text(self, text: str) -> list[float]:
+    def embed_text(self, text: str) -> np.ndarray:
         """
         Embed text using the configured embedding provider.
         
+        Repeated texts are served from the embedding cache without calling
+        the provider.
+        
         Args:
             text: Text to embed
             
         Returns:
-            list[float]: Embedding vector
+            np.ndarray: float32 embedding vector
             
         Raises:
             Exception: If embedding call fails
         """
-        if self.settings.embedding_provider == "local":
-            return self._local_embed(text)
+        key = self.embedding_cache.make_key(self._embedding_namespace, text)
+        cached = self.embedding_cache.get(key)
+        if cached is not None:
+            return cached
 
-        try:
-            response = self.client.embeddings.create(
-                input=text,
-                model=self.settings.embedding_model
+        client = self.client
+        if client is None:  # local provider
+            embedding = self._local_embed(text)
+        else:
+            try:
+                response = client.embeddings.create(
+                    input=text,
+                    model=self.settings.embedding_model
+                )
+                embedding = np.asarray(response.data[0].embedding, dtype=np.float32)
+            except Exception as e:
+                logger.error(f"Embedding failed for text: {text[:50]}... Error: {e}")
+                raise
+
+        self.embedding_cache.put(key, embedding)
+        return embedding
+
+    def embed_batch(self, texts: list[str]) -> list[np.ndarray]:
+        """
+        Embed several texts with a single provider call.
+        
+        The OpenAI embeddings endpoint accepts a list of inputs, so a batch
+        costs one HTTP round-trip instead of one per text. Only texts missing
+        from the embedding cache are sent.
+        
+        Args:
+            texts: Texts to embed
+            
+        Returns:
+            list[np.ndarray]: float32 embedding vectors in the same order as texts
+            
+        Raises:
+            Exception: If embedding call fails
+        """
+        if not texts:
+            return []
+
+        keys, embeddings, missing = self._lookup_cached(texts)
+        if not missing:
+            return cast(list[np.ndarray], embeddings)
+
+        missing_texts = [texts[index] for index in missing]
+        client = self.client
+        if client is None:  # local provider
+            computed = [self._local_embed(text) for text in missing_texts]
+        else:
+            try:
+                response = client.embeddings.create(
+                    input=missing_texts,
+                    model=self.settings.embedding_model
+                )
+                computed = _response_vectors(response)
+            except Exception as e:
+                logger.error(f"Batch embedding failed for {len(missing_texts)} texts. Error: {e}")
+                raise
+
+        return self._store_computed(keys, embeddings, missing, computed)
+
+    async def aembed_text(self, text: str) -> np.ndarray:
+        """
+        Embed text without blocking the event loop.
+        
+        Async counterpart of embed_text() using the AsyncOpenAI client.
+        
+        Args:
+            text: Text to embed
+            
+        Returns:
+            np.ndarray: float32 embedding vector
+            
+        Raises:
+            Exception: If embedding call fails
+        """
+        return (await self.aembed_batch([text]))[0]
+
+    async def aembed_batch(self, texts: list[str]) -> list[np.ndarray]:
+        """
+        Embed several texts without blocking the event loop.
+        
+        Uncached texts are sent in requests of up to EMBEDDING_MAX_BATCH_INPUTS
+        inputs; several requests run concurrently, bounded by
+        embedding_max_concurrency.
+        
+        Args:
+            texts: Texts to embed
+            
+        Returns:
+            list[np.ndarray]: float32 embedding vectors in the same order as texts
+            
+        Raises:
+            Exception: If any embedding call fails
+        """
+        if not texts:
+            return []
+
+        # A persistent embedding cache reads and commits to SQLite, so it is
+        # consulted from a worker thread rather than on the event loop
+        persistent = self.embedding_cache.persistent
+        if persistent:
+            keys, embeddings, missing = await asyncio.to_thread(self._lookup_cached, texts)
+        else:
+            keys, embeddings, missing = self._lookup_cached(texts)
+        if not missing:
+            return cast(list[np.ndarray], embeddings)
+
+        missing_texts = [texts[index] for index in missing]
+        aclient = self.aclient
+        if aclient is None:  # local provider
+            computed = [self._local_embed(text) for text in missing_texts]
+        else:
+            if self._embed_semaphore is None:
+                self._embed_semaphore = asyncio.Semaphore(self.settings.embedding_max_concurrency)
+            semaphore = self._embed_semaphore
+
+            async def embed_chunk(chunk: list[str]) -> list[np.ndarray]:
+                async with semaphore:
+                    response = await aclient.embeddings.create(
+                        input=chunk,
+                        model=self.settings.embedding_model
+                    )
+                return _response_vectors(response)
+
+            try:
+                chunks = await asyncio.gather(*(
+                    embed_chunk(missing_texts[start:start + EMBEDDING_MAX_BATCH_INPUTS])
+                    for start in range(0, len(missing_texts), EMBEDDING_MAX_BATCH_INPUTS)
+                ))
+            except Exception as e:
+                logger.error(f"Async embedding failed for {len(missing_texts)} texts. Error: {e}")
+                raise
+            computed = [embedding for chunk in chunks for embedding in chunk]
+
+        if persistent:
+            return await asyncio.to_thread(
+                self._store_computed, keys, embeddings, missing, computed
             )
-            return response.data[0].embedding
-        except Exception as e:
-            logger.error(f"Embedding failed for text: {text[:50]}... Error: {e}")
-            raise
+        return self._store_computed(keys, embeddings, missing, computed)
 
-    def _local_embed(self, text: str) -> list[float]:
+    def _lookup_cached(
+        self,
+        texts: list[str]
+    ) -> tuple[list[bytes], list[Optional[np.ndarray]], list[int]]:
+        """
+        Resolve texts against the embedding cache.
+        
+        Args:
+            texts: Texts to embed
+            
+        Returns:
+            Cache keys, embeddings (None where not cached) and the indices of
+            the texts that still need embedding; repeated texts are listed
+            once, at their first occurrence
+        """
+        keys = [self.embedding_cache.make_key(self._embedding_namespace, text) for text in texts]
+        embeddings: list[Optional[np.ndarray]] = []
+        missing: list[int] = []
+        seen_missing: set[bytes] = set()
+        for index, key in enumerate(keys):
+            if key in seen_missing:
+                embeddings.append(None)
+                continue
+            cached = self.embedding_cache.get(key)
+            embeddings.append(cached)
+            if cached is None:
+                missing.append(index)
+                seen_missing.add(key)
+        return keys, embeddings, missing
+
+    def _store_computed(
+        self,
+        keys: list[bytes],
+        embeddings: list[Optional[np.ndarray]],
+        missing: list[int],
+        computed: list[np.ndarray]
+    ) -> list[np.ndarray]:
+        """Fill in freshly computed embeddings, cache them and return the full list."""
+        computed_by_key: dict[bytes, np.ndarray] = {}
+        for index, embedding in zip(missing, computed):
+            embeddings[index] = embedding
+            computed_by_key[keys[index]] = embedding
+        self.embedding_cache.put_many(computed_by_key.items())
+        # Repeats of a text embedded in this call share its vector
+        for index, key in enumerate(keys):
+            if embeddings[index] is None:
+                embeddings[index] = computed_by_key[key]
+        return cast(list[np.ndarray], embeddings)
+
+    def _local_embed(self, text: str) -> np.ndarray:
         """
         Generate a deterministic local embedding for offline development.
 
         This is a simple hash-based embedding suitable for demos and tests.
-        It is NOT semantically meaningful like OpenAI embeddings.
+        It is NOT semantically meaningful like OpenAI embeddings. The vector
+        is drawn in one vectorized NumPy call seeded from a fast
+        non-cryptographic XXH3 hash of the text, or from SHA-256 when
+        local_embed_deterministic_crypto is set.
         """
-        import hashlib
-        import random
-
-        digest = hashlib.sha256(text.encode("utf-8")).digest()
-        seed = int.from_bytes(digest, "big")
-        rng = random.Random(seed)
+        data = text.encode("utf-8")
+        if self.settings.local_embed_deterministic_crypto:
+            seed = int.from_bytes(hashlib.sha256(data).digest()[:8], "big")
+        else:
+            seed = xxhash.xxh3_64_intdigest(data)
+        rng = np.random.default_rng(seed)
 
         dim = self.settings.embedding_dimension
-        return [rng.uniform(-1.0, 1.0) for _ in range(dim)]
+        return rng.uniform(-1.0, 1.0, size=dim).astype(np.float32)
 
     def add_airfoil(
         self,
@@ -176,6 +530,134 @@ class RAGEngine:
             logger.error(f"Failed to add airfoil {airfoil_name}: {e}")
             raise
 
+    def add_airfoils_bulk(
+        self,
+        records: list[AirfoilRecord],
+        batch_size: int = 512,
+        write_batch_size: int = VECTOR_STORE_WRITE_BATCH_SIZE,
+        skip_failed: bool = False
+    ) -> int:
+        """
+        Add many airfoil profiles with batched embedding and insert calls.
+        
+        Each batch costs one embeddings request, and embedded records are
+        upserted write_batch_size at a time, instead of one request and one
+        insert per airfoil as with add_airfoil(). Records whose document_id
+        is already stored are replaced, so re-running a load without
+        clearing updates them in place. Records repeating a document_id
+        within ``records`` are collapsed to the last one, since an upsert
+        rejects duplicate ids.
+        
+        Args:
+            records: (airfoil_name, description, metadata, document_id) tuples
+            batch_size: Maximum airfoils per batch (capped at the provider's
+                per-request input limit; batches are also split to stay under
+                its per-request token limit)
+            write_batch_size: Embedded airfoils collected per collection upsert
+            skip_failed: Log and skip batches whose embedding or upsert fails
+                instead of raising
+            
+        Returns:
+            int: Number of airfoils stored
+            
+        Raises:
+            Exception: If embedding or database operation fails (unless
+            skip_failed is set)
+        """
+        records = _unique_by_id(records)
+        stored = 0
+        pending = _UpsertBuffer()
+
+        def write() -> None:
+            nonlocal stored
+            payload = pending.take()
+            try:
+                self.collection.upsert(**payload)
+            except Exception as e:
+                _batch_failed(e, len(payload["ids"]), skip_failed)
+                return
+            stored += len(payload["ids"])
+
+        for batch in _embedding_batches(records, min(batch_size, EMBEDDING_MAX_BATCH_INPUTS)):
+            ids, documents, metadatas = _batch_payload(batch)
+            try:
+                embeddings = self.embed_batch(documents)
+            except Exception as e:
+                _batch_failed(e, len(batch), skip_failed)
+                continue
+            pending.extend(ids, embeddings, documents, metadatas)
+            if len(pending) >= write_batch_size:
+                write()
+            logger.debug(f"Stored {stored}/{len(records)} airfoils")
+        if len(pending):
+            write()
+        return stored
+
+    async def aadd_airfoils_bulk(
+        self,
+        records: list[AirfoilRecord],
+        batch_size: int = 512,
+        write_batch_size: int = VECTOR_STORE_WRITE_BATCH_SIZE,
+        skip_failed: bool = False
+    ) -> int:
+        """
+        Add many airfoil profiles, embedding their batches concurrently.
+        
+        Async counterpart of add_airfoils_bulk(). Every batch's embeddings
+        request is started at once and bounded by embedding_max_concurrency.
+        Embedded records are collected as they arrive and upserted
+        write_batch_size at a time in a worker thread, one upsert at a time.
+        Repeated document_ids are collapsed as in add_airfoils_bulk().
+        
+        Args:
+            records: (airfoil_name, description, metadata, document_id) tuples
+            batch_size: Maximum airfoils per batch (capped as in
+                add_airfoils_bulk())
+            write_batch_size: Embedded airfoils collected per collection upsert
+            skip_failed: Log and skip batches whose embedding or upsert fails
+                instead of raising
+            
+        Returns:
+            int: Number of airfoils stored
+            
+        Raises:
+            Exception: If embedding or database operation fails (unless
+            skip_failed is set)
+        """
+        records = _unique_by_id(records)
+        write_lock = asyncio.Lock()
+        pending = _UpsertBuffer()
+        stored = 0
+
+        async def write(payload: dict[str, list]) -> None:
+            nonlocal stored
+            async with write_lock:
+                try:
+                    await asyncio.to_thread(self.collection.upsert, **payload)
+                except Exception as e:
+                    _batch_failed(e, len(payload["ids"]), skip_failed)
+                    return
+            stored += len(payload["ids"])
+
+        async def store(batch: list[AirfoilRecord]) -> None:
+            ids, documents, metadatas = _batch_payload(batch)
+            try:
+                embeddings = await self.aembed_batch(documents)
+            except Exception as e:
+                _batch_failed(e, len(batch), skip_failed)
+                return
+            # No await between extend() and take(), so concurrent batches
+            # never split or repeat a write
+            pending.extend(ids, embeddings, documents, metadatas)
+            if len(pending) >= write_batch_size:
+                await write(pending.take())
+
+        batches = _embedding_batches(records, min(batch_size, EMBEDDING_MAX_BATCH_INPUTS))
+        await asyncio.gather(*(store(batch) for batch in batches))
+        if len(pending):
+            await write(pending.take())
+        return stored
+
     def search_similar(
         self,
         query_text: str,
@@ -197,54 +679,372 @@ class RAGEngine:
             - Returns results sorted by relevance (highest first)
             - Filters by configured similarity threshold
         """
+        query_embedding = self.embed_text(query_text)
+        return self.search_by_embedding(query_embedding, limit)
+
+    async def asearch_similar(
+        self,
+        query_text: str,
+        limit: Optional[int] = None
+    ) -> list[tuple[str, float, dict]]:
+        """
+        Async counterpart of search_similar().
+        
+        The embedding is awaited on the event loop; the Chroma query is
+        synchronous and runs in a worker thread.
+        
+        Args:
+            query_text: Description of the desired wing characteristics
+            limit: Maximum number of results (uses config default if None)
+            
+        Returns:
+            list of tuples: (document, similarity_score, metadata)
+        """
+        query_embedding = await self.aembed_text(query_text)
+        return await asyncio.to_thread(self.search_by_embedding, query_embedding, limit)
+
+    def search_by_embedding(
+        self,
+        query_embedding: np.ndarray,
+        limit: Optional[int] = None
+    ) -> list[tuple[str, float, dict]]:
+        """
+        Search for similar designs using an already computed query embedding.
+        
+        Lets callers that need the embedding themselves (e.g. the semantic
+        response cache) embed the query once.
+        
+        Args:
+            query_embedding: Embedding of the query text
+            limit: Maximum number of results (uses config default if None)
+            
+        Returns:
+            list of tuples: (document, similarity_score, metadata)
+        """
+        return self.search_by_embeddings([query_embedding], limit)[0]
+
+    def search_by_embeddings(
+        self,
+        query_embeddings: list[np.ndarray],
+        limit: Optional[int] = None
+    ) -> list[list[tuple[str, float, dict]]]:
+        """
+        Run several similarity searches in one vector database query.
+        
+        Args:
+            query_embeddings: Embeddings of the query texts
+            limit: Maximum number of results per query (config default if None)
+            
+        Returns:
+            One list of (document, similarity_score, metadata) tuples per query,
+            in the same order as query_embeddings
+        """
         if limit is None:
             limit = self.settings.rag_top_k_results
+        if not query_embeddings:
+            return []
             
         try:
-            query_embedding = self.embed_text(query_text)
             results = self.collection.query(
-                query_embeddings=[query_embedding],
+                query_embeddings=query_embeddings,
                 n_results=limit
             )
             
-            # Format results as (document, score, metadata) tuples
-            formatted_results = []
-            if results and results["documents"] and len(results["documents"]) > 0:
-                for doc, distance, metadata in zip(
-                    results["documents"][0],
-                    results["distances"][0],
-                    results["metadatas"][0]
-                ):
-                    # Chroma returns distance; convert to similarity (1 - distance)
-                    similarity = 1 - distance
-                    
-                    # Filter by threshold
-                    if similarity >= self.settings.rag_similarity_threshold:
-                        formatted_results.append((doc, similarity, metadata))
+            # Format results as (document, score, metadata) tuples per query
+            threshold = self.settings.rag_similarity_threshold
+            batch_results: list[list[tuple[str, float, dict]]] = []
+            documents = (results or {}).get("documents") or []
+            for query_index in range(len(query_embeddings)):
+                if query_index >= len(documents) or not documents[query_index]:
+                    batch_results.append([])
+                    continue
+                # Chroma returns distance; convert to similarity (1 - distance)
+                # and filter by threshold in one vectorized pass
+                similarities = 1.0 - np.asarray(results["distances"][query_index], dtype=np.float64)
+                keep = np.flatnonzero(similarities >= threshold)
+                docs = documents[query_index]
+                metadatas = results["metadatas"][query_index]
+                batch_results.append([
+                    (docs[i], float(similarities[i]), metadatas[i]) for i in keep.tolist()
+                ])
             
-            logger.debug(f"Search returned {len(formatted_results)} results")
-            return formatted_results
+            logger.debug(f"Search returned {sum(map(len, batch_results))} results "
+                         f"for {len(query_embeddings)} queries")
+            return batch_results
             
         except Exception as e:
             logger.error(f"Search failed: {e}")
             raise
 
+    def to_configuration_results(
+        self,
+        matches: list[tuple[str, float, dict]],
+        wing_spec: WingSpecification
+    ) -> list[SimilarConfigurationResult]:
+        """
+        Format raw search matches as API results.
+        
+        Args:
+            matches: (document, similarity_score, metadata) tuples from a search
+            wing_spec: Wing specification the performance is estimated for
+            
+        Returns:
+            list[SimilarConfigurationResult]: Ranked results (rank is 1-based),
+            built without re-validation
+        """
+        results = []
+        for rank, (_, similarity, metadata) in enumerate(matches, start=1):
+            score = min(max(similarity, 0.0), 1.0)
+            results.append(SimilarConfigurationResult.from_rag(
+                rank=rank,
+                similarity_score=score,
+                metadata=metadata,
+                performance=estimate_performance(metadata, wing_spec, score),
+                default_source=DEFAULT_RESULT_SOURCE
+            ))
+        return results
+
+    async def aclose(self) -> None:
+        """Close the embeddings clients and their connection pools."""
+        if self.client is not None:
+            self.client.close()
+        if self.aclient is not None:
+            await self.aclient.close()
+
     def clear_collection(self) -> None:
         """
         Clear all documents from the collection.
         
         Uses for testing and data reset scenarios.
         Be careful: this is destructive.
+        
+        Drops the collection instead of fetching and deleting every id, so
+        the cost does not grow with the collection size, then recreates it
+        empty straight away (like TRUNCATE rather than DELETE FROM). The
+        first insert after a clear finds the collection ready, and
+        ``collection`` returns the new handle.
         """
         try:
-            # Get all IDs and delete them
-            all_data = self.collection.get()
-            if all_data and all_data["ids"]:
-                self.collection.delete(ids=all_data["ids"])
-            logger.info("Collection cleared")
+            if self.settings.vector_store == "sqlite-vec":
+                self.collection.drop()
+                self.collection.close()
+            else:
+                self._delete_chroma_collection()
         except Exception as e:
             logger.error(f"Failed to clear collection: {e}")
             raise
+        finally:
+            self._collection = None
+        self.refresh_collection()
+        logger.info("Collection cleared")
+
+    def refresh_collection(self) -> Any:
+        """
+        Drop the cached collection handle and open the collection again.
+        
+        Returns:
+            The collection, created with the configured schema and metadata
+            if it does not exist
+        """
+        self._collection = None
+        return self.collection
+
+    def _delete_chroma_collection(self) -> None:
+        """Drop the Chroma collection, ignoring one that was never created."""
+        from chromadb.errors import NotFoundError
+
+        try:
+            self.chroma_client.delete_collection(name=self.settings.rag_collection_name)
+        except NotFoundError:
+            pass  # Nothing stored yet
+
+
+def _openai_http_clients(settings: Settings) -> tuple["httpx.Client", "httpx.AsyncClient"]:
+    """
+    Build the pooled HTTP clients behind the OpenAI embeddings clients.
+    
+    Pools are sized to embedding_max_concurrency and keep idle connections
+    for openai_keepalive_expiry_s, so bursts of embedding calls reuse warm
+    connections instead of paying a TCP/TLS handshake each. With
+    OPENAI_HTTP2 enabled, concurrent async requests are multiplexed over a
+    single connection.
+    
+    Args:
+        settings: Application settings
+        
+    Returns:
+        tuple: (sync client, async client)
+        
+    Raises:
+        RuntimeError: If HTTP/2 is requested but h2 is not installed
+    """
+    import httpx
+
+    timeout = httpx.Timeout(OPENAI_TIMEOUT_S, connect=OPENAI_CONNECT_TIMEOUT_S)
+    limits = httpx.Limits(
+        max_connections=settings.embedding_max_concurrency,
+        max_keepalive_connections=settings.embedding_max_concurrency,
+        keepalive_expiry=settings.openai_keepalive_expiry_s
+    )
+    try:
+        async_client = httpx.AsyncClient(
+            http2=settings.openai_http2,
+            limits=limits,
+            timeout=timeout,
+            follow_redirects=True
+        )
+    except ImportError as e:
+        raise RuntimeError(
+            "OPENAI_HTTP2=true requires the h2 package "
+            "(pip install 'wing-aerodynamic-analyzer[http2]')"
+        ) from e
+    client = httpx.Client(limits=limits, timeout=timeout, follow_redirects=True)
+    return client, async_client
+
+
+def _response_vectors(response) -> list[np.ndarray]:
+    """
+    Extract float32 vectors from an embeddings API response in input order.
+    
+    Args:
+        response: OpenAI embeddings response
+        
+    Returns:
+        list[np.ndarray]: One vector per input
+    """
+    return [
+        np.asarray(item.embedding, dtype=np.float32)
+        for item in sorted(response.data, key=lambda d: d.index)
+    ]
+
+
+def _batch_payload(batch: list[AirfoilRecord]) -> tuple[list[str], list[str], list[dict]]:
+    """
+    Transpose airfoil records into collection insert arguments.
+    
+    The same description list is both embedded and stored as the documents.
+    
+    Args:
+        batch: (airfoil_name, description, metadata, document_id) tuples
+        
+    Returns:
+        tuple: (ids, documents, metadatas) with airfoil_name added to metadata
+    """
+    names, documents, metadatas, ids = map(list, zip(*batch))
+    return ids, documents, [
+        {"airfoil_name": airfoil_name, **metadata}
+        for airfoil_name, metadata in zip(names, metadatas)
+    ]
+
+
+class _UpsertBuffer:
+    """Embedded records collected for the next collection upsert."""
+
+    __slots__ = ("ids", "embeddings", "documents", "metadatas")
+
+    def __init__(self) -> None:
+        self.ids: list[str] = []
+        self.embeddings: list[np.ndarray] = []
+        self.documents: list[str] = []
+        self.metadatas: list[dict] = []
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def extend(
+        self,
+        ids: list[str],
+        embeddings: list[np.ndarray],
+        documents: list[str],
+        metadatas: list[dict]
+    ) -> None:
+        """Append one embedded batch."""
+        self.ids += ids
+        self.embeddings += embeddings
+        self.documents += documents
+        self.metadatas += metadatas
+
+    def take(self) -> dict[str, list]:
+        """Return the collected records as upsert() keyword arguments and empty the buffer."""
+        payload: dict[str, list] = {
+            "ids": self.ids,
+            "embeddings": self.embeddings,
+            "documents": self.documents,
+            "metadatas": self.metadatas
+        }
+        self.ids, self.embeddings, self.documents, self.metadatas = [], [], [], []
+        return payload
+
+
+def _batch_failed(error: Exception, count: int, skip_failed: bool) -> None:
+    """
+    Handle a bulk-load batch whose embedding or upsert raised.
+    
+    Args:
+        error: The exception raised for the batch
+        count: Airfoils in the failed batch
+        skip_failed: Log and return instead of re-raising
+        
+    Raises:
+        Exception: error itself, unless skip_failed is set
+    """
+    if not skip_failed:
+        logger.error(f"Failed to add batch of {count} airfoils: {error}")
+        raise error
+    logger.error(f"Skipping batch of {count} airfoils that failed to store: {error}")
+
+
+def _unique_by_id(records: list[AirfoilRecord]) -> list[AirfoilRecord]:
+    """
+    Drop records whose document_id is repeated later in the list.
+    
+    Args:
+        records: (airfoil_name, description, metadata, document_id) tuples
+        
+    Returns:
+        list[AirfoilRecord]: One record per document_id (the last one), in
+        first-seen order
+    """
+    unique = {record[3]: record for record in records}
+    if len(unique) == len(records):
+        return records
+    logger.warning(f"Skipping {len(records) - len(unique)} airfoils with a repeated "
+                   f"document id (keeping the last of each)")
+    return list(unique.values())
+
+
+def _embedding_batches(
+    records: list[AirfoilRecord],
+    max_inputs: int
+) -> Iterator[list[AirfoilRecord]]:
+    """
+    Split records into batches that fit one embeddings request.
+    
+    Records are ordered by description length first (stable, so equal
+    lengths keep their order), so each batch holds texts of similar length:
+    the provider pads less within a batch and the token budget is filled
+    evenly. Insertion order does not matter for the upserts.
+    
+    Args:
+        records: Airfoil records to split
+        max_inputs: Maximum records per batch
+        
+    Yields:
+        list[AirfoilRecord]: Length-sorted records within both request limits
+    """
+    max_inputs = max(1, max_inputs)
+    batch: list[AirfoilRecord] = []
+    batch_tokens = 0
+    for record in sorted(records, key=lambda record: len(record[1])):
+        tokens = len(record[1]) // CHARS_PER_TOKEN_ESTIMATE + 1
+        full = len(batch) >= max_inputs or batch_tokens + tokens > EMBEDDING_MAX_BATCH_TOKENS
+        if batch and full:
+            yield batch
+            batch, batch_tokens = [], 0
+        batch.append(record)
+        batch_tokens += tokens
+    if batch:
+        yield batch
 
 
 # Global RAG engine instance
@@ -0,0 +1,206 @@
+"""
+sqlite-vec vector store backend.
+
+Chroma is the default vector store. Setting VECTOR_STORE=sqlite-vec stores the
+airfoil vectors in a sqlite-vec ``vec0`` virtual table instead, where the
+similarity computation runs inside the SQLite C extension.
+
+SqliteVecCollection implements the subset of the Chroma collection API that
+RAGEngine uses (add, upsert, query, count), so the engine's search and formatting code
+is shared by both backends.
+
+Requires the optional ``sqlite-vec`` package and a Python build whose sqlite3
+module can load extensions.
+"""
+import logging
+import re
+import sqlite3
+import threading
+from pathlib import Path
+
+import orjson
+
+from app.models import pack_embedding
+
+logger = logging.getLogger(__name__)
+
+_TABLE_NAME_PATTERN = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+class SqliteVecCollection:
+    """
+    Chroma-compatible collection stored in a sqlite-vec virtual table.
+
+    Responsibilities:
+    - Create the ``vec0`` table (cosine distance) on first use
+    - Insert documents with their embeddings and JSON metadata
+    - Answer k-nearest-neighbour queries in Chroma's result layout
+
+    Distances are cosine distances, so ``1 - distance`` is the cosine
+    similarity RAGEngine reports.
+    """
+
+    def __init__(self, path: Path, name: str, dimension: int):
+        """
+        Open (or create) the vector table.
+
+        Args:
+            path: SQLite database file
+            name: Table name (the configured collection name)
+            dimension: Embedding dimension
+
+        Raises:
+            RuntimeError: If sqlite-vec is not installed or cannot be loaded
+            ValueError: If name is not a valid SQL identifier
+        """
+        if not _TABLE_NAME_PATTERN.match(name):
+            raise ValueError(f"Invalid collection name for sqlite-vec: {name!r}")
+        self.name = name
+        self.dimension = dimension
+        self._lock = threading.Lock()
+        self._db = self._connect(path)
+        self._db.execute(
+            f'CREATE VIRTUAL TABLE IF NOT EXISTS "{name}" USING vec0('
+            f"doc_id TEXT PRIMARY KEY, "
+            f"embedding float[{dimension}] distance_metric=cosine, "
+            f"+document TEXT, "
+            f"+metadata TEXT)"
+        )
+        self._db.commit()
+        logger.debug("sqlite-vec table '%s' ready at %s", name, path)
+
+    @staticmethod
+    def _connect(path: Path) -> sqlite3.Connection:
+        """Open the database and load the sqlite-vec extension."""
+        try:
+            import sqlite_vec
+        except ImportError as e:
+            raise RuntimeError(
+                "VECTOR_STORE=sqlite-vec requires the sqlite-vec package "
+                "(pip install 'wing-aerodynamic-analyzer[sqlite-vec]')"
+            ) from e
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Worker threads (asyncio.to_thread) share the connection under _lock
+        db = sqlite3.connect(str(path), check_same_thread=False)
+        if not hasattr(db, "enable_load_extension"):
+            db.close()
+            raise RuntimeError(
+                "This Python's sqlite3 module cannot load extensions, "
+                "which sqlite-vec requires"
+            )
+        db.enable_load_extension(True)
+        sqlite_vec.load(db)
+        db.enable_load_extension(False)
+        return db
+
+    def add(
+        self,
+        ids: list[str],
+        embeddings: list,
+        documents: list[str],
+        metadatas: list[dict]
+    ) -> None:
+        """
+        Insert documents in one transaction.
+
+        Args:
+            ids: Unique document ids
+            embeddings: Embedding vectors
+            documents: Document texts
+            metadatas: Metadata dictionaries (stored as JSON)
+
+        Raises:
+            sqlite3.IntegrityError: If an id is already stored
+        """
+        rows = self._rows(ids, embeddings, documents, metadatas)
+        with self._lock, self._db:
+            self._db.executemany(self._insert_sql(), rows)
+
+    def upsert(
+        self,
+        ids: list[str],
+        embeddings: list,
+        documents: list[str],
+        metadatas: list[dict]
+    ) -> None:
+        """
+        Insert documents, replacing any already stored under the same ids.
+        
+        vec0 tables do not support ``INSERT OR REPLACE``, so existing rows
+        are deleted and the batch inserted in one transaction.
+        
+        Args:
+            ids: Unique document ids
+            embeddings: Embedding vectors
+            documents: Document texts
+            metadatas: Metadata dictionaries (stored as JSON)
+        """
+        rows = self._rows(ids, embeddings, documents, metadatas)
+        with self._lock, self._db:
+            self._db.executemany(
+                f'DELETE FROM "{self.name}" WHERE doc_id = ?',
+                [(doc_id,) for doc_id in ids]
+            )
+            self._db.executemany(self._insert_sql(), rows)
+
+    def _insert_sql(self) -> str:
+        """INSERT statement for one document row."""
+        return (
+            f'INSERT INTO "{self.name}" (doc_id, embedding, document, metadata) '
+            f"VALUES (?, ?, ?, ?)"
+        )
+
+    @staticmethod
+    def _rows(
+        ids: list[str],
+        embeddings: list,
+        documents: list[str],
+        metadatas: list[dict]
+    ) -> list[tuple]:
+        """Pack parallel document lists into table rows."""
+        return [
+            (doc_id, pack_embedding(embedding), document, orjson.dumps(metadata).decode())
+            for doc_id, embedding, document, metadata in zip(ids, embeddings, documents, metadatas)
+        ]
+
+    def query(self, query_embeddings: list, n_results: int) -> dict:
+        """
+        Find the nearest documents for each query embedding.
+
+        Args:
+            query_embeddings: Query vectors
+            n_results: Neighbours to return per query
+
+        Returns:
+            dict: Chroma-style ``ids``/``documents``/``metadatas``/``distances``
+            with one inner list per query, nearest first
+        """
+        results: dict[str, list] = {"ids": [], "documents": [], "metadatas": [], "distances": []}
+        sql = (
+            f'SELECT doc_id, document, metadata, distance FROM "{self.name}" '
+            f"WHERE embedding MATCH ? AND k = ? ORDER BY distance"
+        )
+        with self._lock:
+            for embedding in query_embeddings:
+                rows = self._db.execute(sql, (pack_embedding(embedding), n_results)).fetchall()
+                results["ids"].append([row[0] for row in rows])
+                results["documents"].append([row[1] for row in rows])
+                results["metadatas"].append([orjson.loads(row[2]) for row in rows])
+                results["distances"].append([row[3] for row in rows])
+        return results
+
+    def count(self) -> int:
+        """Number of stored documents."""
+        with self._lock:
+            return self._db.execute(f'SELECT COUNT(*) FROM "{self.name}"').fetchone()[0]
+
+    def drop(self) -> None:
+        """Delete the table and everything in it."""
+        with self._lock, self._db:
+            self._db.execute(f'DROP TABLE IF EXISTS "{self.name}"')
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._db.close()
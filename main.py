@@ -9,16 +9,23 @@ Usage:
         
     Production:
         gunicorn -w 4 -k uvicorn.workers.UvicornWorker main:app
+        
+    The uvicorn[standard] extra provides uvloop and httptools; uvicorn (and its
+    gunicorn worker) picks them automatically, and `python main.py` requests
+    them explicitly together with the APP_BACKLOG / APP_LIMIT_CONCURRENCY
+    settings.
 """
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
 
 from app.api.routes import router
-from app.core.config import get_settings
+from app.core.config import Settings, ensure_runtime_dirs, get_settings
+from app.core.middleware import ProcessTimeMiddleware
+from app.core.responses import OrjsonResponse
 
 # Configure logging
 logging.basicConfig(
@@ -38,10 +45,12 @@ async def lifespan(app: FastAPI):
     Manage application startup and shutdown.
     
     Startup:
-    - Initialize settings
+    - Read the settings published by create_app()
+    - Create data and log directories
     - Validate API keys
-    - Initialize RAG engine and vector database
+    - Initialize RAG engine and vector database, warm up embeddings
     - Register MCP tools
+    - Publish shared services on app.state for request handlers
     
     Shutdown:
     - Clean up resources
@@ -52,12 +61,17 @@ async def lifespan(app: FastAPI):
     logger.info("=" * 80)
     
     try:
-        settings = get_settings()
+        settings: Settings = app.state.settings
         logger.info(f"Environment: {settings.app_env}")
         logger.info(f"Debug mode: {settings.app_debug}")
-        logger.info(f"Vector DB path: {settings.chroma_path}")
+        if settings.chroma_host:
+            logger.info(f"Vector DB server: {settings.chroma_host}:{settings.chroma_port}")
+        else:
+            logger.info(f"Vector DB path: {settings.chroma_path}")
         logger.info(f"Airfoil data path: {settings.airfoil_data_path}")
         
+        ensure_runtime_dirs(settings)
+        
         # Validate API keys before startup
         if not settings.openai_api_key:
             raise ValueError(
@@ -66,16 +80,39 @@ async def lifespan(app: FastAPI):
             )
         logger.info("✓ OpenAI API key configured")
         
-        # Initialize RAG engine (lazy-loaded, but validate here)
+        # Initialize shared services once and publish them on app.state so
+        # request handlers never hit a lazy-initialization path
+        from app.batching import get_rag_proxy
+        from app.cache import get_response_cache
+        from app.mcp_tools import get_tool_registry
         from app.rag import get_rag_engine
+        
         rag_engine = get_rag_engine(settings)
+        app.state.rag_engine = rag_engine
+        await asyncio.to_thread(rag_engine.check_vector_store)
         logger.info("✓ RAG engine initialized")
         
-        # Initialize MCP tool registry
-        from app.mcp_tools import get_tool_registry
-        tool_registry = get_tool_registry()
+        # Warm the embedding path (client connection pool / local model) so
+        # the first search does not pay for it
+        try:
+            await rag_engine.aembed_text("warmup")
+            logger.info("✓ Embedding provider warmed up")
+        except Exception as e:
+            logger.warning(f"Embedding warm-up failed, continuing: {e}")
+        
+        app.state.response_cache = get_response_cache(settings)
+        app.state.rag_proxy = get_rag_proxy(settings)
+        
+        tool_registry = get_tool_registry(settings)
+        app.state.tool_registry = tool_registry
         logger.info(f"✓ MCP tool registry initialized ({len(tool_registry.list_tools())} tools)")
         
+        # Build the OpenAPI document now: it generates JSON schemas for every
+        # request/response model, which FastAPI otherwise does lazily on the
+        # first /docs or /openapi.json request.
+        app.openapi()
+        logger.info("✓ OpenAPI schema generated")
+        
         logger.info("=" * 80)
         logger.info("API startup complete - ready to accept requests")
         logger.info("=" * 80)
@@ -90,6 +127,66 @@ async def lifespan(app: FastAPI):
     logger.info("=" * 80)
     logger.info("Shutting down Wing Aerodynamic Analyzer API")
     logger.info("=" * 80)
+    
+    started_engine = getattr(app.state, "rag_engine", None)
+    if started_engine is not None:
+        await started_engine.aclose()
+    
+    # Drop the closed engine and the proxy built around it, so a later
+    # startup in this process builds fresh ones, and close the embedding
+    # cache's SQLite connection
+    from app.batching import reset_rag_proxy
+    from app.cache import reset_embedding_cache
+    from app.rag import reset_rag_engine
+    
+    app.state.rag_engine = None
+    app.state.rag_proxy = None
+    reset_rag_proxy()
+    reset_rag_engine()
+    reset_embedding_cache()
+
+
+# =============================================================================
+# Exception Handlers
+# =============================================================================
+
+def build_exception_handlers(settings: Settings) -> dict:
+    """
+    Build the application-level exception handlers.
+    
+    Passed to the FastAPI constructor so they are installed once with the
+    exception middleware. Full tracebacks are only formatted in debug mode;
+    elsewhere unexpected errors log a single line.
+    
+    Args:
+        settings: Application settings (app_debug controls tracebacks)
+        
+    Returns:
+        dict: Exception class -> handler, for ``FastAPI(exception_handlers=...)``
+    """
+    log_tracebacks = settings.app_debug
+
+    async def value_error_handler(request, exc):
+        """Handle validation errors gracefully."""
+        detail = str(exc)
+        logger.warning("Validation error: %s", detail)
+        return OrjsonResponse(
+            status_code=400,
+            content={"detail": detail}
+        )
+
+    async def general_exception_handler(request, exc):
+        """Handle unexpected errors."""
+        logger.error("Unexpected error: %s", exc, exc_info=log_tracebacks)
+        return OrjsonResponse(
+            status_code=500,
+            content={"detail": "Internal server error"}
+        )
+
+    return {
+        ValueError: value_error_handler,
+        Exception: general_exception_handler,
+    }
 
 
 # =============================================================================
@@ -102,8 +199,9 @@ def create_app() -> FastAPI:
     
     Configuration includes:
     - Metadata and documentation
-    - CORS middleware
-    - Exception handlers
+    - orjson-rendered JSON responses by default
+    - CORS and request timing middleware
+    - Exception handlers (see build_exception_handlers)
     - Route registration
     - Lifespan management
     
@@ -123,42 +221,33 @@ def create_app() -> FastAPI:
         docs_url="/docs",
         redoc_url="/redoc",
         openapi_url="/openapi.json",
+        default_response_class=OrjsonResponse,
+        exception_handlers=build_exception_handlers(settings),
         lifespan=lifespan
     )
+    # One Settings instance for the whole app; lifespan and handlers read it
+    # from app.state instead of resolving it again
+    app.state.settings = settings
     
     # =========================================================================
-    # CORS Middleware
-    # =========================================================================
-    
-    app.add_middleware(
-        CORSMiddleware,
-        allow_origins=["*"] if settings.app_debug else ["http://localhost:3000"],
-        allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
-    )
-    
-    # =========================================================================
-    # Exception Handlers
+    # Middleware
     # =========================================================================
     
-    @app.exception_handler(ValueError)
-    async def value_error_handler(request, exc):
-        """Handle validation errors gracefully."""
-        logger.warning(f"Validation error: {exc}")
-        return JSONResponse(
-            status_code=400,
-            content={"detail": str(exc)}
+    # Deployments called only by server-side clients can set CORS_ENABLED=false
+    # to drop the middleware from the request path entirely. Origins are a
+    # frozenset so Starlette's per-request membership test is a hash lookup.
+    if settings.cors_enabled:
+        app.add_middleware(
+            CORSMiddleware,
+            allow_origins=frozenset(["*"] if settings.app_debug else settings.cors_allow_origins),
+            allow_credentials=True,
+            allow_methods=["*"],
+            allow_headers=["*"],
+            expose_headers=["X-Process-Time"],
         )
     
-    @app.exception_handler(Exception)
-    async def general_exception_handler(request, exc):
-        """Handle unexpected errors."""
-        logger.error(f"Unexpected error: {exc}", exc_info=True)
-        return JSONResponse(
-            status_code=500,
-            content={"detail": "Internal server error"}
-        )
+    # Added last so it is outermost and times the full middleware stack
+    app.add_middleware(ProcessTimeMiddleware)
     
     # =========================================================================
     # Route Registration
@@ -170,7 +259,7 @@ def create_app() -> FastAPI:
     # Root Endpoint
     # =========================================================================
     
-    @app.get("/", tags=["root"])
+    @app.get("/", tags=["root"], response_model=None)
     async def root():
         """Root endpoint with API information."""
         return {
@@ -193,13 +282,21 @@ app = create_app()
 # =============================================================================
 
 if __name__ == "__main__":
+    import sys
+
     import uvicorn
     
-    settings = get_settings()
+    settings = app.state.settings
     uvicorn.run(
         app,
         host=settings.app_host,
         port=settings.app_port,
         reload=settings.app_debug,
-        log_level=settings.log_level.lower()
+        log_level=settings.log_level.lower(),
+        # libuv event loop and C HTTP parser (uvloop is unavailable on Windows)
+        loop="auto" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        backlog=settings.app_backlog,
+        limit_concurrency=settings.app_limit_concurrency,
+        access_log=settings.app_env != "production"
     )
@@ -8,24 +8,32 @@ This script:
 4. Stores vectors in Chroma database
 
 Usage:
-    python scripts/load_data.py [--clear] [--csv-path /path/to/data.csv]
+    python scripts/load_data.py [--clear] [--csv-path /path/to/data.csv] [--batch-size N]
     
     Options:
         --clear: Clear existing data before loading (fresh start)
         --csv-path: Path to airfoil CSV file (defaults to data/uiuc_airfoils.csv)
+        --batch-size: Airfoils per embeddings request / insert (default: 2048
+            for CSV files up to 1 MiB, 512 for larger ones)
 """
 import argparse
-import csv
+import asyncio
 import logging
+import os
 import sys
+import time
+from itertools import starmap
 from pathlib import Path
-from typing import Generator
+from typing import Generator, Optional
+
+import numpy as np
+import pandas as pd
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from app.core.config import Settings, get_settings
-from app.rag import RAGEngine
+from app.core.config import Settings, ensure_runtime_dirs, get_settings
+from app.rag import EMBEDDING_MAX_BATCH_INPUTS, AirfoilRecord, RAGEngine
 
 # Configure logging
 logging.basicConfig(
@@ -34,6 +42,36 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Rows buffered per flush. Each flush is split into length-sorted batches of
+# --batch-size, so a window larger than one batch groups similar-length
+# descriptions together.
+LENGTH_SORT_WINDOW = 4096
+
+# Numeric CSV columns, in AirfoilData argument order
+NUMERIC_FIELDS = ("thickness_percent", "camber_percent", "max_cl", "max_cd")
+
+# Columns read from the CSV; any others are ignored
+CSV_FIELDS = frozenset({"name", *NUMERIC_FIELDS})
+
+# Default batch sizes: a small CSV goes out in as few embeddings requests as
+# the API allows, a large one in smaller batches that run concurrently
+SMALL_CSV_MAX_BYTES = 1 << 20
+SMALL_CSV_BATCH_SIZE = EMBEDDING_MAX_BATCH_INPUTS
+LARGE_CSV_BATCH_SIZE = 512
+
+# Minimum seconds between progress log lines
+PROGRESS_LOG_INTERVAL_S = 1.0
+
+# Generated airfoil description; positional fields follow AirfoilRow order
+DESCRIPTION_TEMPLATE = (
+    "{0} airfoil with {1:.1f}% thickness and {2:.1f}% camber. "
+    "Characteristics: max CL {3:.2f}, min CD {4:.4f}. "
+    "Suitable for general aviation and racing applications."
+)
+
+# (name, thickness_percent, camber_percent, max_cl, max_cd)
+AirfoilRow = tuple[str, float, float, float, float]
+
 
 # =============================================================================
 # Data Structures
@@ -42,6 +80,11 @@ logger = logging.getLogger(__name__)
 class AirfoilData:
     """Container for airfoil metadata and characteristics."""
     
+    # One instance per CSV row; slots avoid a per-instance __dict__
+    __slots__ = (
+        "name", "thickness_percent", "camber_percent", "max_cl", "max_cd", "description"
+    )
+    
     def __init__(
         self,
         name: str,
@@ -71,22 +114,85 @@ class AirfoilData:
     
     def _generate_description(self) -> str:
         """Generate a description from aerodynamic characteristics."""
-        return (
-            f"{self.name} airfoil with {self.thickness_percent:.1f}% thickness "
-            f"and {self.camber_percent:.1f}% camber. "
-            f"Characteristics: max CL {self.max_cl:.2f}, min CD {self.max_cd:.4f}. "
-            f"Suitable for general aviation and racing applications."
+        return DESCRIPTION_TEMPLATE.format(
+            self.name, self.thickness_percent, self.camber_percent, self.max_cl, self.max_cd
         )
     
     def to_metadata(self) -> dict:
         """Convert to metadata dictionary for vector store."""
-        return {
-            "thickness_percent": self.thickness_percent,
-            "camber_percent": self.camber_percent,
-            "max_cl": self.max_cl,
-            "max_cd": self.max_cd,
-            "name": self.name
-        }
+        return _airfoil_metadata(
+            self.name, self.thickness_percent, self.camber_percent, self.max_cl, self.max_cd
+        )
+
+
+def _document_id(name: str) -> str:
+    """
+    Build the vector store document id for an airfoil name.
+    
+    str.replace with a single-character pattern is faster here than
+    str.translate with a mapping table.
+    """
+    return f"airfoil_{name.replace(' ', '_').lower()}"
+
+
+def _airfoil_metadata(
+    name: str,
+    thickness_percent: float,
+    camber_percent: float,
+    max_cl: float,
+    max_cd: float
+) -> dict:
+    """Build the vector store metadata dictionary for one airfoil."""
+    return {
+        "thickness_percent": thickness_percent,
+        "camber_percent": camber_percent,
+        "max_cl": max_cl,
+        "max_cd": max_cd,
+        "name": name
+    }
+
+
+def default_batch_size(csv_size_bytes: int) -> int:
+    """
+    Choose the bulk-load batch size for a CSV file.
+    
+    Args:
+        csv_size_bytes: Size of the CSV file
+        
+    Returns:
+        int: SMALL_CSV_BATCH_SIZE up to SMALL_CSV_MAX_BYTES, otherwise
+        LARGE_CSV_BATCH_SIZE
+    """
+    if csv_size_bytes <= SMALL_CSV_MAX_BYTES:
+        return SMALL_CSV_BATCH_SIZE
+    return LARGE_CSV_BATCH_SIZE
+
+
+def _recheck_coerced(raw: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """
+    Re-parse the cells pandas could not coerce, with float().
+    
+    pd.to_numeric rejects a few spellings that float() accepts ("nan",
+    "1_0"), so the rare coerced cells are retried one by one and the accepted
+    rows match float() parsing exactly.
+    
+    Args:
+        raw: Object array of CSV strings, shape (rows, len(NUMERIC_FIELDS))
+        values: float64 array from pd.to_numeric (NaN where coercion failed),
+            updated in place with any value float() accepts
+        
+    Returns:
+        np.ndarray: Boolean mask of cells float() also rejects
+    """
+    invalid = np.isnan(values)
+    for row, column in zip(*np.nonzero(invalid)):
+        try:
+            value = float(raw[row, column])
+        except ValueError:
+            continue
+        values[row, column] = value
+        invalid[row, column] = False
+    return invalid
 
 
 # =============================================================================
@@ -113,9 +219,15 @@ class AirfoilDataLoader:
         """
         self.rag_engine = rag_engine
         self.csv_path = Path(csv_path)
+        self._stored = 0
+        self._failed = 0
+        self._last_log = 0.0
         
-        if not self.csv_path.exists():
-            raise FileNotFoundError(f"CSV file not found: {self.csv_path}")
+        # One stat serves both the existence check and batch sizing
+        try:
+            self._stat = os.stat(self.csv_path)
+        except OSError as e:
+            raise FileNotFoundError(f"CSV file not found: {self.csv_path}") from e
         
         logger.info(f"Data loader initialized with CSV: {self.csv_path}")
     
@@ -126,63 +238,103 @@ class AirfoilDataLoader:
         Yields:
             AirfoilData: Parsed airfoil records
             
+        Raises:
+            ValueError: If CSV format is invalid
+        """
+        yield from starmap(AirfoilData, self.load_from_csv_tuples())
+    
+    def load_from_csv_tuples(self) -> Generator[AirfoilRow, None, None]:
+        """
+        Load airfoil rows from CSV file as plain tuples.
+        
+        Bulk loading only needs the field values, so this skips building an
+        AirfoilData object per row. The file is memory-mapped and parsed in
+        one pandas read_csv call (C tokenizer), and the numeric columns are
+        coerced as whole columns; rows with an invalid number or an empty
+        name are logged and skipped. Columns and trailing row fields beyond
+        CSV_FIELDS are ignored.
+        
+        Yields:
+            AirfoilRow: (name, thickness_percent, camber_percent, max_cl, max_cd)
+            
         Raises:
             ValueError: If CSV format is invalid
         """
         try:
-            with open(self.csv_path, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                
-                # Validate headers
-                if not reader.fieldnames:
-                    raise ValueError("CSV file is empty or has no headers")
-                
-                required_fields = {
-                    'name', 'thickness_percent', 'camber_percent',
-                    'max_cl', 'max_cd'
-                }
-                missing_fields = required_fields - set(reader.fieldnames)
-                if missing_fields:
-                    raise ValueError(
-                        f"CSV missing required fields: {missing_fields}\n"
-                        f"Found: {reader.fieldnames}"
-                    )
-                
-                for row_num, row in enumerate(reader, start=2):  # start=2 (after header)
-                    try:
-                        # Parse numeric fields
-                        thickness = float(row['thickness_percent'])
-                        camber = float(row['camber_percent'])
-                        max_cl = float(row['max_cl'])
-                        max_cd = float(row['max_cd'])
-                        name = row['name'].strip()
-                        
-                        if not name:
-                            logger.warning(f"Row {row_num}: Empty airfoil name, skipping")
-                            continue
-                        
-                        yield AirfoilData(
-                            name=name,
-                            thickness_percent=thickness,
-                            camber_percent=camber,
-                            max_cl=max_cl,
-                            max_cd=max_cd
-                        )
-                        
-                    except ValueError as e:
-                        logger.warning(f"Row {row_num}: Invalid numeric value, skipping: {e}")
-                        continue
+            # An empty file cannot be memory-mapped
+            if self._stat.st_size == 0:
+                raise ValueError("CSV file is empty or has no headers")
+            try:
+                # memory_map lets the C parser read the file through the
+                # page cache instead of buffered Python reads. Selecting the
+                # columns also drops extra trailing fields on a row, which
+                # read_csv would otherwise reject for the whole file.
+                frame = pd.read_csv(
+                    self.csv_path,
+                    usecols=lambda column: column in CSV_FIELDS,
+                    dtype=str,
+                    keep_default_na=False,
+                    encoding="utf-8",
+                    engine="c",
+                    memory_map=True
+                )
+            except pd.errors.EmptyDataError:
+                raise ValueError("CSV file is empty or has no headers") from None
+            
+            # Validate headers
+            missing_fields = CSV_FIELDS - set(frame.columns)
+            if missing_fields:
+                raise ValueError(
+                    f"CSV missing required fields: {missing_fields}\n"
+                    f"Found: {list(frame.columns)}"
+                )
+            
+            # Parse numeric fields
+            raw = frame[list(NUMERIC_FIELDS)]
+            values = raw.apply(pd.to_numeric, errors="coerce").to_numpy(
+                dtype=np.float64, copy=True
+            )
+            invalid = _recheck_coerced(raw.to_numpy(), values).any(axis=1)
+            names = frame["name"].str.strip()
+            empty = ~invalid & (names == "").to_numpy()
+            
+            # Row numbers count the header as line 1
+            if logger.isEnabledFor(logging.WARNING):
+                for row_num in frame.index[invalid] + 2:
+                    logger.warning("Row %d: Invalid numeric value, skipping", row_num)
+                for row_num in frame.index[empty] + 2:
+                    logger.warning("Row %d: Empty airfoil name, skipping", row_num)
+            
+            # Columns follow AirfoilRow's order, so zip() builds the rows
+            # without a per-row Python loop
+            valid = ~(invalid | empty)
+            columns = [values[valid, index].tolist() for index in range(len(NUMERIC_FIELDS))]
+            yield from zip(names[valid].tolist(), *columns)
         
         except Exception as e:
             logger.error(f"Failed to load CSV file: {e}")
             raise
     
-    def populate_database(self, clear_first: bool = False) -> int:
+    async def populate_database(
+        self,
+        clear_first: bool = False,
+        batch_size: Optional[int] = None
+    ) -> int:
         """
         Load all airfoils and populate RAG database.
         
+        Parsed rows are buffered in windows of LENGTH_SORT_WINDOW (or
+        batch_size, if larger) and each full window is flushed as its own
+        task, split into batches of similar description length. Embeddings
+        requests for different batches are in flight together (bounded by
+        EMBEDDING_MAX_CONCURRENCY). A batch whose embedding or insert fails
+        is logged and skipped, and the load carries on with the rest.
+        Progress is logged at most once per PROGRESS_LOG_INTERVAL_S.
+        
         Args:
             clear_first: If True, clear existing data before loading
+            batch_size: Airfoils embedded and inserted per batch (None picks
+                SMALL_CSV_BATCH_SIZE or LARGE_CSV_BATCH_SIZE from the file size)
             
         Returns:
             int: Number of airfoils added
@@ -190,41 +342,74 @@ class AirfoilDataLoader:
         Raises:
             Exception: If database operations fail
         """
-        count = 0
-        
+        if batch_size is None:
+            batch_size = default_batch_size(self._stat.st_size)
+        flushes: list[asyncio.Task[int]] = []
+        self._stored = 0
+        self._failed = 0
+        self._last_log = time.monotonic()
         try:
             # Clear existing data if requested
             if clear_first:
                 logger.info("Clearing existing data...")
-                self.rag_engine.clear_collection()
+                await asyncio.to_thread(self.rag_engine.clear_collection)
             
-            # Load and store airfoils
+            # Stream airfoils from the CSV, starting a flush for each full batch
             logger.info("Loading airfoil data from CSV...")
-            for airfoil in self.load_from_csv():
-                document_id = f"airfoil_{airfoil.name.replace(' ', '_').lower()}"
-                
-                try:
-                    self.rag_engine.add_airfoil(
-                        airfoil_name=airfoil.name,
-                        description=airfoil.description,
-                        metadata=airfoil.to_metadata(),
-                        document_id=document_id
-                    )
-                    count += 1
-                    
-                    if count % 50 == 0:
-                        logger.info(f"Progress: {count} airfoils loaded...")
-                
-                except Exception as e:
-                    logger.error(f"Failed to add airfoil {airfoil.name}: {e}")
-                    continue
+            window = max(batch_size, LENGTH_SORT_WINDOW)
+            pending: list[AirfoilRecord] = []
+            # Bound once; flushes are triggered by len(pending), so the
+            # per-row loop keeps no counter of its own
+            describe = DESCRIPTION_TEMPLATE.format
+            for row in self.load_from_csv_tuples():
+                name = row[0]
+                pending.append((
+                    name,
+                    describe(*row),
+                    _airfoil_metadata(*row),
+                    _document_id(name)
+                ))
+                if len(pending) >= window:
+                    flushes.append(asyncio.create_task(self._flush(pending, batch_size)))
+                    pending = []
+                    await asyncio.sleep(0)  # let the flush send its request
+            if pending:
+                flushes.append(asyncio.create_task(self._flush(pending, batch_size)))
             
+            count = sum(await asyncio.gather(*flushes))
+            if self._failed:
+                logger.warning(f"{self._failed} airfoils were not stored "
+                               f"(failed batches or repeated names)")
             logger.info(f"✓ Successfully loaded {count} airfoils into vector store")
             return count
         
         except Exception as e:
+            for flush in flushes:
+                flush.cancel()
             logger.error(f"Database population failed: {e}")
             raise
+    
+    async def _flush(self, pending: list[AirfoilRecord], batch_size: int) -> int:
+        """
+        Embed and store buffered airfoils, skipping batches that fail.
+        
+        Args:
+            pending: Buffered (name, description, metadata, document_id) records
+            batch_size: Maximum airfoils per embeddings request / insert
+            
+        Returns:
+            int: Number of airfoils added
+        """
+        added = await self.rag_engine.aadd_airfoils_bulk(
+            pending, batch_size=batch_size, skip_failed=True
+        )
+        self._stored += added
+        self._failed += len(pending) - added
+        now = time.monotonic()
+        if now - self._last_log >= PROGRESS_LOG_INTERVAL_S:
+            logger.info("Progress: %d airfoils loaded...", self._stored)
+            self._last_log = now
+        return added
 
 
 # =============================================================================
@@ -246,28 +431,48 @@ def main():
         type=Path,
         help="Path to airfoil CSV file (default: data/uiuc_airfoils.csv)"
     )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        help=(
+            f"Airfoils embedded and inserted per batch (default: "
+            f"{SMALL_CSV_BATCH_SIZE} for CSV files up to 1 MiB, "
+            f"{LARGE_CSV_BATCH_SIZE} for larger ones)"
+        )
+    )
     
     args = parser.parse_args()
     
     try:
         # Load settings
         settings = get_settings()
+        ensure_runtime_dirs(settings)
         
         # Determine CSV path
         csv_path = args.csv_path or settings.airfoil_data_path
-        if not csv_path.exists():
-            logger.error(f"CSV file not found: {csv_path}")
-            logger.info("\nPlease ensure you have the UIUC airfoil dataset.")
-            logger.info("See README.md for instructions on downloading the data.")
-            return 1
         
         # Initialize RAG engine
         logger.info("Initializing RAG engine...")
         rag_engine = RAGEngine(settings)
         
         # Create loader and populate database
-        loader = AirfoilDataLoader(rag_engine, csv_path)
-        count = loader.populate_database(clear_first=args.clear)
+        try:
+            loader = AirfoilDataLoader(rag_engine, csv_path)
+        except FileNotFoundError:
+            logger.error(f"CSV file not found: {csv_path}")
+            logger.info("\nPlease ensure you have the UIUC airfoil dataset.")
+            logger.info("See README.md for instructions on downloading the data.")
+            return 1
+        
+        async def load() -> int:
+            try:
+                return await loader.populate_database(
+                    clear_first=args.clear, batch_size=args.batch_size
+                )
+            finally:
+                await rag_engine.aclose()
+        
+        count = asyncio.run(load())
         
         logger.info("=" * 80)
         logger.info(f"Data loading complete: {count} airfoils stored")
@@ -0,0 +1,121 @@
+"""
+Shared pytest fixtures.
+
+Engines, collections and the API test client are built once per test module
+instead of once per test. Tests that need different settings, patch an
+engine's clients, or destroy data build their own instead.
+
+The shared engine keeps its collection in an in-memory Chroma client, so
+parallel runs (``pytest -n auto --dist loadfile``) give every worker process
+its own vector store with nothing on disk.
+
+No test reaches the OpenAI API: embeddings requests made through the SDK are
+answered locally with deterministic fake vectors.
+"""
+import zlib
+from types import SimpleNamespace
+
+import chromadb
+import numpy as np
+import pytest
+from chromadb.config import Settings as ChromaSettings
+from fastapi.testclient import TestClient
+
+from app.cache import EmbeddingCache
+from app.core.config import Settings
+from app.rag import RAGEngine
+
+# (name, description, metadata, document_id) records for populated_collection
+SAMPLE_AIRFOILS = [
+    (
+        "NACA 0012",
+        "NACA 0012 symmetric airfoil with 12% thickness",
+        {"name": "NACA 0012", "thickness_percent": 12.0, "max_cl": 1.2, "max_cd": 0.006},
+        "airfoil_naca_0012"
+    ),
+    (
+        "NACA 2412",
+        "NACA 2412 cambered airfoil with 12% thickness and 2% camber",
+        {"name": "NACA 2412", "thickness_percent": 12.0, "max_cl": 1.4, "max_cd": 0.007},
+        "airfoil_naca_2412"
+    ),
+    (
+        "NACA 23012",
+        "NACA 23012 high-lift airfoil with 11.6% thickness and 2.5% camber",
+        {"name": "NACA 23012", "thickness_percent": 11.6, "max_cl": 1.45, "max_cd": 0.0085},
+        "airfoil_naca_23012"
+    ),
+]
+
+
+# Dimension of the fake vectors when a request does not ask for one
+# (text-embedding-3-small's default)
+FAKE_EMBEDDING_DIMENSION = 1536
+
+
+def fake_embedding(text: str, dimension: int = FAKE_EMBEDDING_DIMENSION) -> np.ndarray:
+    """Deterministic stand-in for an OpenAI embedding of text."""
+    # crc32 rather than hash(), which is salted per process
+    rng = np.random.default_rng(zlib.crc32(text.encode("utf-8")))
+    return rng.standard_normal(dimension).astype(np.float32)
+
+
+def _fake_embeddings_response(input, dimensions=None) -> SimpleNamespace:
+    """Build an embeddings response shaped like the SDK's."""
+    texts = [input] if isinstance(input, str) else input
+    dimension = dimensions or FAKE_EMBEDDING_DIMENSION
+    return SimpleNamespace(data=[
+        SimpleNamespace(index=index, embedding=fake_embedding(text, dimension).tolist())
+        for index, text in enumerate(texts)
+    ])
+
+
+@pytest.fixture(autouse=True)
+def _fake_openai_embeddings(monkeypatch):
+    """Answer OpenAI SDK embeddings calls locally instead of over the network."""
+    from openai.resources.embeddings import AsyncEmbeddings, Embeddings
+
+    def create(self, *, input, model, dimensions=None, **kwargs):
+        return _fake_embeddings_response(input, dimensions)
+
+    async def acreate(self, *, input, model, dimensions=None, **kwargs):
+        return _fake_embeddings_response(input, dimensions)
+
+    monkeypatch.setattr(Embeddings, "create", create)
+    monkeypatch.setattr(AsyncEmbeddings, "create", acreate)
+
+
+@pytest.fixture(scope="session")
+def settings(tmp_path_factory) -> Settings:
+    """Offline settings: local embeddings, anything on disk in a temporary directory."""
+    return Settings(
+        embedding_provider="local",
+        embedding_dimension=8,
+        chroma_path=tmp_path_factory.mktemp("vector_store") / "chroma"
+    )
+
+
+@pytest.fixture(scope="module")
+def rag_engine(settings) -> RAGEngine:
+    """RAG engine over an in-memory Chroma store."""
+    engine = RAGEngine(settings, embedding_cache=EmbeddingCache(capacity=0))
+    engine._chroma_client = chromadb.EphemeralClient(
+        settings=ChromaSettings(anonymized_telemetry=False)
+    )
+    return engine
+
+
+@pytest.fixture(scope="module")
+def populated_collection(rag_engine):
+    """The engine's collection holding exactly SAMPLE_AIRFOILS."""
+    rag_engine.clear_collection()
+    rag_engine.add_airfoils_bulk(SAMPLE_AIRFOILS)
+    return rag_engine.collection
+
+
+@pytest.fixture(scope="module")
+def client() -> TestClient:
+    """Test client for the application (lifespan not started)."""
+    from main import app
+
+    return TestClient(app)
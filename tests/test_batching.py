@@ -0,0 +1,220 @@
+"""
+Tests for batched RAG similarity searches.
+
+Test coverage:
+- Coalescing concurrent searches into one embedding and one search call
+- Per-request result limits
+- Response cache reuse
+- Error propagation and cancellation
+"""
+import asyncio
+
+import pytest
+
+from app.batching import BatchingRAGProxy, _order_by_proximity
+from app.cache import EmbeddingCache, SemanticResponseCache
+from app.core.config import Settings
+from app.models import SimilarAirfoilRequest
+from app.rag import RAGEngine, estimate_performance
+
+
+class FakeRAGEngine:
+    """Engine stub that records batch sizes."""
+
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.embed_calls: list[int] = []
+        self.search_calls: list[tuple[int, int]] = []
+
+    async def aembed_batch(self, texts):
+        self.embed_calls.append(len(texts))
+        if self.fail:
+            raise RuntimeError("embedding service down")
+        return [[float(len(text)), 1.0] for text in texts]
+
+    def search_by_embeddings(self, embeddings, limit):
+        self.search_calls.append((len(embeddings), limit))
+        return [[(f"doc{i}", 0.9, {}) for i in range(limit)] for _ in embeddings]
+
+    def to_configuration_results(self, matches, wing_spec):
+        return [doc for doc, _, _ in matches]
+
+
+class EstimatingRAGEngine(FakeRAGEngine):
+    """Engine stub whose results carry the requested geometry's downforce."""
+
+    def search_by_embeddings(self, embeddings, limit):
+        self.search_calls.append((len(embeddings), limit))
+        return [[("doc", 0.9, {"max_cl": 1.4, "max_cd": 0.01})] for _ in embeddings]
+
+    def to_configuration_results(self, matches, wing_spec):
+        return [
+            estimate_performance(metadata, wing_spec, similarity).downforce_kg
+            for _, similarity, metadata in matches
+        ]
+
+
+def make_request(chord_mm: float, limit: int = 5) -> SimilarAirfoilRequest:
+    """Build a search request for the given chord."""
+    return SimilarAirfoilRequest(
+        wing_spec={
+            "wing_type": "single_element",
+            "chord_mm": chord_mm,
+            "span_mm": 1400,
+            "target_downforce_kg": 45,
+            "operating_speed_kph": 200
+        },
+        limit=limit
+    )
+
+
+def make_proxy(engine, capacity: int = 0) -> BatchingRAGProxy:
+    """Build a proxy with a short batching window."""
+    return BatchingRAGProxy(
+        rag_engine=engine,
+        response_cache=SemanticResponseCache(capacity=capacity, max_distance=0.0001),
+        window_ms=5,
+        max_batch_size=32
+    )
+
+
+class TestBatchingRAGProxy:
+    """Test request coalescing."""
+
+    def test_concurrent_searches_share_calls(self):
+        """Test that concurrent submissions are embedded and searched together."""
+        engine = FakeRAGEngine()
+        proxy = make_proxy(engine)
+
+        async def run():
+            return await asyncio.gather(
+                proxy.submit(make_request(350, limit=2)),
+                proxy.submit(make_request(1000, limit=4)),
+            )
+
+        small, large = asyncio.run(run())
+
+        assert engine.embed_calls == [2]
+        assert engine.search_calls == [(2, 4)]
+        assert len(small) == 2
+        assert len(large) == 4
+
+    def test_cache_hit_skips_search(self):
+        """Test that a cached query is not searched again."""
+        engine = FakeRAGEngine()
+        proxy = make_proxy(engine, capacity=8)
+
+        async def run():
+            await proxy.submit(make_request(350))
+            return await proxy.submit(make_request(350))
+
+        asyncio.run(run())
+
+        assert engine.embed_calls == [1, 1]
+        assert engine.search_calls == [(1, 5)]
+
+    def test_cache_hit_estimates_for_its_own_spec(self):
+        """Test that nearby specs sharing cached matches get their own performance."""
+        engine = EstimatingRAGEngine()
+        proxy = make_proxy(engine, capacity=8)
+
+        async def run():
+            first = await proxy.submit(make_request(351))
+            return first, await proxy.submit(make_request(354))
+
+        first, second = asyncio.run(run())
+
+        assert engine.search_calls == [(1, 5)]
+        assert first != second
+        assert second[0] > first[0]
+
+    def test_errors_reach_every_caller(self):
+        """Test that a failed batch raises in each waiting request."""
+        proxy = make_proxy(FakeRAGEngine(fail=True))
+
+        async def run():
+            return await asyncio.gather(
+                proxy.submit(make_request(350)),
+                proxy.submit(make_request(400)),
+                return_exceptions=True
+            )
+
+        results = asyncio.run(run())
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    def test_cancelled_flush_cancels_every_caller(self):
+        """Test that cancelling an in-flight batch does not leave requests waiting."""
+        class StalledRAGEngine(FakeRAGEngine):
+            async def aembed_batch(self, texts):
+                await asyncio.Event().wait()
+
+        proxy = make_proxy(StalledRAGEngine())
+
+        async def run():
+            searches = asyncio.gather(
+                proxy.submit(make_request(350)),
+                proxy.submit(make_request(400)),
+                return_exceptions=True
+            )
+            while not proxy._flush_tasks:
+                await asyncio.sleep(0.001)
+            for task in proxy._flush_tasks:
+                task.cancel()
+            return await asyncio.wait_for(searches, timeout=1)
+
+        results = asyncio.run(run())
+
+        assert all(isinstance(r, asyncio.CancelledError) for r in results)
+
+    def test_order_by_proximity(self):
+        """Test that neighbouring embeddings are visited consecutively."""
+        embeddings = [[1.0, 0.0], [0.0, 1.0], [0.99, 0.1], [0.1, 0.99]]
+
+        assert _order_by_proximity(embeddings) == [0, 2, 3, 1]
+
+    def test_query_text_buckets_nearby_specs(self):
+        """Test that near-identical specs share one query text."""
+        text = make_request(352).wing_spec.to_query_text()
+
+        assert text == make_request(348).wing_spec.to_query_text()
+        assert text != make_request(360).wing_spec.to_query_text()
+        assert text == (
+            "single element wing with 350mm chord and 1400mm span, "
+            "targeting 45kg downforce at 200kph"
+        )
+
+    def test_bucketed_specs_keep_exact_performance(self):
+        """Test that specs sharing a query text still get their own estimates."""
+        class OneMatchCollection:
+            def __init__(self):
+                self.queries = 0
+
+            def query(self, query_embeddings, n_results):
+                self.queries += 1
+                return {
+                    "documents": [["NACA 2412"] for _ in query_embeddings],
+                    "distances": [[0.1] for _ in query_embeddings],
+                    "metadatas": [[{"max_cl": 1.4, "max_cd": 0.007}] for _ in query_embeddings],
+                }
+
+        engine = RAGEngine(
+            Settings(embedding_provider="local", embedding_dimension=8),
+            embedding_cache=EmbeddingCache(capacity=16)
+        )
+        engine._collection = OneMatchCollection()
+        proxy = BatchingRAGProxy(
+            rag_engine=engine,
+            response_cache=SemanticResponseCache(capacity=8, max_distance=0.02),
+            window_ms=5,
+            max_batch_size=32
+        )
+
+        async def run():
+            first = await proxy.submit(make_request(348))
+            return first, await proxy.submit(make_request(352))
+
+        first, second = asyncio.run(run())
+
+        assert engine._collection.queries == 1
+        assert first[0].performance.downforce_kg < second[0].performance.downforce_kg
@@ -0,0 +1,170 @@
+"""
+Tests for the semantic response cache.
+
+Test coverage:
+- Exact and near-duplicate hits
+- Misses for distant queries and different limits
+- Empty results are not cached
+- LRU eviction
+- Clearing
+- Embedding cache hits, eviction and SQLite persistence
+"""
+import numpy as np
+import pytest
+
+from app.cache import EmbeddingCache, SemanticResponseCache
+from app.models import pack_embedding, unpack_embedding
+
+
+class TestSemanticResponseCache:
+    """Test approximate caching of search results."""
+
+    def test_exact_query_hits(self):
+        """Test that the same embedding returns the cached results."""
+        cache = SemanticResponseCache(capacity=4, max_distance=0.01)
+        results = ["result"]
+        cache.put([1.0, 0.0, 0.0], 5, results)
+
+        assert cache.get([1.0, 0.0, 0.0], 5) is results
+        assert cache.hits == 1
+
+    def test_near_duplicate_hits(self):
+        """Test that a query within the distance tolerance is a hit."""
+        cache = SemanticResponseCache(capacity=4, max_distance=0.01)
+        cache.put([1.0, 0.0, 0.0], 5, ["result"])
+
+        assert cache.get([1.0, 0.01, 0.0], 5) == ["result"]
+
+    def test_distant_query_misses(self):
+        """Test that a dissimilar query is a miss."""
+        cache = SemanticResponseCache(capacity=4, max_distance=0.01)
+        cache.put([1.0, 0.0, 0.0], 5, ["result"])
+
+        assert cache.get([0.0, 1.0, 0.0], 5) is None
+        assert cache.misses == 1
+
+    def test_limit_must_match(self):
+        """Test that results cached for one limit are not reused for another."""
+        cache = SemanticResponseCache(capacity=4, max_distance=0.01)
+        cache.put([1.0, 0.0, 0.0], 5, ["result"])
+
+        assert cache.get([1.0, 0.0, 0.0], 10) is None
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted when full."""
+        cache = SemanticResponseCache(capacity=2, max_distance=0.01)
+        cache.put([1.0, 0.0, 0.0], 5, ["x"])
+        cache.put([0.0, 1.0, 0.0], 5, ["y"])
+        cache.get([1.0, 0.0, 0.0], 5)
+        cache.put([0.0, 0.0, 1.0], 5, ["z"])
+
+        assert len(cache) == 2
+        assert cache.get([0.0, 1.0, 0.0], 5) is None
+        assert cache.get([1.0, 0.0, 0.0], 5) == ["x"]
+        assert cache.get([0.0, 0.0, 1.0], 5) == ["z"]
+
+    def test_dimension_change_drops_results(self):
+        """Test that resizing for a new embedding dimension drops every stored result."""
+        cache = SemanticResponseCache(capacity=2, max_distance=0.01)
+        cache.put([1.0, 0.0, 0.0], 5, ["x"])
+        cache.put([0.0, 1.0, 0.0], 5, ["y"])
+
+        cache.put([1.0, 0.0], 5, ["z"])
+
+        assert len(cache) == 1
+        assert [r for r in cache._results if r is not None] == [["z"]]
+        assert cache.get([1.0, 0.0], 5) == ["z"]
+
+    def test_disabled_cache(self):
+        """Test that a zero-capacity cache never stores results."""
+        cache = SemanticResponseCache(capacity=0, max_distance=1.0)
+        cache.put([1.0, 0.0], 5, ["result"])
+
+        assert cache.get([1.0, 0.0], 5) is None
+
+    def test_empty_results_not_cached(self):
+        """Test that a search that matched nothing is searched again next time."""
+        cache = SemanticResponseCache(capacity=4, max_distance=0.01)
+        cache.put([1.0, 0.0, 0.0], 5, [])
+
+        assert len(cache) == 0
+        assert cache.get([1.0, 0.0, 0.0], 5) is None
+
+    def test_clear(self):
+        """Test clearing all entries."""
+        cache = SemanticResponseCache(capacity=4, max_distance=0.01)
+        cache.put([1.0, 0.0, 0.0], 5, ["result"])
+        cache.clear()
+
+        assert len(cache) == 0
+        assert cache.get([1.0, 0.0, 0.0], 5) is None
+
+
+class TestEmbeddingCache:
+    """Test exact caching of text embeddings."""
+
+    def test_keys_depend_on_namespace(self):
+        """Test that the same text embedded by different models gets distinct keys."""
+        first = EmbeddingCache.make_key("openai:a", "text")
+
+        assert first != EmbeddingCache.make_key("openai:b", "text")
+
+    def test_put_then_get(self):
+        """Test that a stored embedding is returned as float32."""
+        cache = EmbeddingCache(capacity=4)
+        key = EmbeddingCache.make_key("m", "wing")
+        cache.put(key, [0.5, -0.25])
+
+        vector = cache.get(key)
+        assert vector.dtype == np.float32
+        assert vector.tolist() == [0.5, -0.25]
+        assert cache.hits == 1
+
+    def test_lru_eviction(self):
+        """Test that the least recently used vector is evicted from memory."""
+        cache = EmbeddingCache(capacity=1)
+        first, second = EmbeddingCache.make_key("m", "a"), EmbeddingCache.make_key("m", "b")
+        cache.put(first, [1.0])
+        cache.put(second, [2.0])
+
+        assert len(cache) == 1
+        assert cache.get(first) is None
+
+    def test_persists_across_instances(self, tmp_path):
+        """Test that embeddings written to SQLite are found by a new cache."""
+        path = tmp_path / "embeddings.sqlite3"
+        key = EmbeddingCache.make_key("m", "wing")
+        writer = EmbeddingCache(capacity=4, path=path)
+        writer.put(key, [1.0, 2.0, 3.0])
+        writer.close()
+
+        reader = EmbeddingCache(capacity=4, path=path)
+        assert reader.get(key).tolist() == [1.0, 2.0, 3.0]
+        reader.close()
+
+    def test_put_many_persists_every_vector(self, tmp_path):
+        """Test that a batch stored in one transaction is found by a new cache."""
+        path = tmp_path / "embeddings.sqlite3"
+        keys = [EmbeddingCache.make_key("m", text) for text in ("a", "b", "c")]
+        writer = EmbeddingCache(capacity=4, path=path)
+        writer.put_many(zip(keys, ([1.0], [2.0], [3.0])))
+        writer.close()
+
+        reader = EmbeddingCache(capacity=4, path=path)
+        assert [reader.get(key).tolist() for key in keys] == [[1.0], [2.0], [3.0]]
+        reader.close()
+
+    def test_disabled_cache(self):
+        """Test that a zero-capacity cache never stores embeddings."""
+        cache = EmbeddingCache(capacity=0)
+        key = EmbeddingCache.make_key("m", "wing")
+        cache.put(key, [1.0])
+
+        assert cache.get(key) is None
+
+    def test_packed_embedding_round_trip(self):
+        """Test that packed embeddings are 4 bytes per dimension and unpack unchanged."""
+        blob = pack_embedding([0.5, -1.0, 2.0])
+
+        assert isinstance(blob, bytes) and len(blob) == 12
+        assert unpack_embedding(blob).tolist() == [0.5, -1.0, 2.0]
@@ -0,0 +1,104 @@
+"""
+Tests for the CSV data loader script.
+
+Test coverage:
+- Parsing numeric CSV fields like float()
+- Rows with too many or too few fields
+- Loading a CSV into the vector store
+- Repeated airfoil names within one load
+- Skipping batches that fail to embed
+"""
+import asyncio
+
+from scripts.load_data import AirfoilDataLoader
+
+CSV_HEADER = "name,thickness_percent,camber_percent,max_cl,max_cd\n"
+
+
+class TestLoadFromCSV:
+    """Test CSV parsing."""
+
+    def test_numbers_parse_like_float(self, rag_engine, tmp_path):
+        """Test that rows are kept exactly when float() accepts all their numbers."""
+        csv_path = tmp_path / "airfoils.csv"
+        csv_path.write_text(
+            CSV_HEADER
+            + "NACA 0012, 12 ,0.0,1.2,0.006\n"
+            + "Negative,-5.0,0.0,1.2,-0.006\n"
+            + "Not a number,nan,1_0,inf,1e-3\n"
+            + "Bad,abc,0.0,1.2,0.006\n"
+            + " ,12.0,0.0,1.2,0.006\n"
+        )
+        loader = AirfoilDataLoader(rag_engine, csv_path)
+
+        rows = list(loader.load_from_csv_tuples())
+
+        assert [row[0] for row in rows] == ["NACA 0012", "Negative", "Not a number"]
+        assert rows[0][1:] == (12.0, 0.0, 1.2, 0.006)
+        assert rows[1][1:] == (-5.0, 0.0, 1.2, -0.006)
+        assert rows[2][2:] == (10.0, float("inf"), 1e-3)
+
+    def test_malformed_rows_do_not_abort(self, rag_engine, tmp_path):
+        """Test that extra trailing fields are ignored and short rows are skipped."""
+        csv_path = tmp_path / "airfoils.csv"
+        csv_path.write_text(
+            CSV_HEADER
+            + "NACA 0012,12.0,0.0,1.2,0.006\n"
+            + "EXTRA,12,0,1.2,0.01,99\n"
+            + "SHORT,12.0,0.0\n"
+            + "NACA 2412,12.0,2.0,1.4,0.007\n"
+        )
+        loader = AirfoilDataLoader(rag_engine, csv_path)
+
+        rows = list(loader.load_from_csv_tuples())
+
+        assert [row[0] for row in rows] == ["NACA 0012", "EXTRA", "NACA 2412"]
+        assert rows[1][1:] == (12.0, 0.0, 1.2, 0.01)
+
+
+class TestPopulateDatabase:
+    """Test bulk loading airfoils from CSV."""
+
+    def test_duplicate_names_keep_last_row(self, rag_engine, tmp_path):
+        """Test that names mapping to one document id load once, last row winning."""
+        csv_path = tmp_path / "airfoils.csv"
+        csv_path.write_text(
+            CSV_HEADER
+            + "NACA 0012,12.0,0.0,1.2,0.006\n"
+            + "NACA 2412,12.0,2.0,1.4,0.007\n"
+            + "naca 0012,12.0,0.0,1.3,0.006\n"
+        )
+        loader = AirfoilDataLoader(rag_engine, csv_path)
+
+        count = asyncio.run(loader.populate_database(clear_first=True))
+
+        assert count == 2
+        assert rag_engine.collection.count() == 2
+        stored = rag_engine.collection.get(ids=["airfoil_naca_0012"])
+        assert stored["metadatas"][0]["name"] == "naca 0012"
+
+    def test_failed_batch_is_skipped(self, rag_engine, tmp_path, monkeypatch):
+        """Test that one failing embeddings batch does not abort the load."""
+        csv_path = tmp_path / "airfoils.csv"
+        csv_path.write_text(
+            CSV_HEADER
+            + "NACA 0012,12.0,0.0,1.2,0.006\n"
+            + "BAD 1,12.0,2.0,1.4,0.007\n"
+            + "NACA 23012,11.6,2.5,1.45,0.0085\n"
+        )
+        embed_batch = rag_engine.aembed_batch
+
+        async def flaky_embed_batch(texts):
+            if any(text.startswith("BAD") for text in texts):
+                raise RuntimeError("embedding service error")
+            return await embed_batch(texts)
+
+        monkeypatch.setattr(rag_engine, "aembed_batch", flaky_embed_batch)
+        loader = AirfoilDataLoader(rag_engine, csv_path)
+
+        count = asyncio.run(loader.populate_database(clear_first=True, batch_size=1))
+
+        assert count == 2
+        assert sorted(rag_engine.collection.get()["ids"]) == [
+            "airfoil_naca_0012", "airfoil_naca_23012"
+        ]
@@ -7,8 +7,19 @@ Test coverage:
 - Input validation
 - Error handling
 """
+import asyncio
+import threading
+
 import pytest
 
+from app.mcp_tools import (
+    DownforceEstimatorTool,
+    FlowInfluencePredictorTool,
+    MCPTool,
+    MCPToolRegistry,
+    _estimate_downforce,
+)
+
 
 class TestMCPToolRegistry:
     """Test MCP tool registry functionality."""
@@ -23,6 +34,56 @@ class TestMCPToolRegistry:
         # Implementation in Week 1
         pass
 
+    def test_list_tools_cached_until_register(self):
+        """Test that the catalog is reused and rebuilt after registration."""
+        registry = MCPToolRegistry()
+        catalog = registry.list_tools()
+        assert registry.list_tools() is catalog
+
+        class EchoTool(FlowInfluencePredictorTool):
+            name = "echo"
+
+        registry.register(EchoTool())
+        refreshed = registry.list_tools()
+        assert refreshed is not catalog
+        assert [tool["name"] for tool in refreshed][-1] == "echo"
+
+    def test_sync_tool_runs_in_thread(self):
+        """Test that a synchronous execute() is dispatched to a worker thread."""
+        class BlockingTool(FlowInfluencePredictorTool):
+            name = "blocking"
+
+            def execute(self, **kwargs) -> dict:
+                return {"thread": threading.get_ident()}
+
+        registry = MCPToolRegistry()
+        registry.register(BlockingTool())
+        output = asyncio.run(registry.execute_tool("blocking"))
+
+        assert output.success
+        assert output.result["thread"] != threading.get_ident()
+
+    def test_tool_must_implement_execute(self):
+        """Test that a tool without execute() fails when created, not when called."""
+        class IncompleteTool(MCPTool):
+            name = "incomplete"
+            description = "Missing execute()"
+
+        with pytest.raises(TypeError, match="execute"):
+            IncompleteTool()
+
+    def test_execution_time_only_when_enabled(self):
+        """Test that per-tool timing is opt-in."""
+        kwargs = {"wing_chord_mm": 250, "wing_span_mm": 1500}
+
+        untimed = asyncio.run(MCPToolRegistry().execute_tool("predict_flow_influence", **kwargs))
+        timed = asyncio.run(
+            MCPToolRegistry(time_execution=True).execute_tool("predict_flow_influence", **kwargs)
+        )
+
+        assert untimed.execution_time_ms is None
+        assert timed.execution_time_ms >= 0
+
     def test_get_tool(self):
         """Test retrieving a tool by name."""
         # Implementation in Week 1
@@ -52,6 +113,32 @@ class TestDownforceTool:
         # Implementation in Week 1
         pass
 
+    def test_nearby_inputs_share_cached_estimate(self):
+        """Inputs within the same rounding bucket reuse one cached estimate."""
+        _estimate_downforce.cache_clear()
+        tool = DownforceEstimatorTool()
+
+        first = asyncio.run(
+            tool.execute(airfoil="NACA 4412", speed_kph=201, chord_mm=251, span_mm=1498)
+        )
+        first["estimated_downforce_kg"] = -1.0
+        second = asyncio.run(
+            tool.execute(airfoil="NACA 4412", speed_kph=199, chord_mm=249, span_mm=1502)
+        )
+
+        info = _estimate_downforce.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+        assert second["estimated_downforce_kg"] != -1.0
+
+    def test_missing_airfoil_is_not_cached(self):
+        """Test that a call without an airfoil fails instead of caching an estimate for None."""
+        _estimate_downforce.cache_clear()
+
+        with pytest.raises(KeyError):
+            asyncio.run(DownforceEstimatorTool().execute(speed_kph=200, chord_mm=250, span_mm=1500))
+
+        assert _estimate_downforce.cache_info().currsize == 0
+
 
 class TestFlowInfluenceTool:
     """Test flow influence prediction tool."""
@@ -7,53 +7,404 @@ Test coverage:
 - Similarity search
 - Error handling
 """
-import pytest
+import asyncio
+import importlib.util
+import sqlite3
+import threading
 from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from app import rag
+from app.cache import EmbeddingCache
+from app.core.config import Settings
 
 
 class TestRAGEngine:
     """Test RAG engine functionality."""
 
-    def test_rag_engine_initialization(self):
+    def test_rag_engine_initialization(self, rag_engine, settings):
         """Test that RAG engine initializes without errors."""
-        # Implementation in Week 1
-        pass
+        assert rag_engine.settings is settings
+        assert rag_engine.client is None  # local provider needs no API client
+
+    def test_embed_text(self, rag_engine, settings):
+        """Test that text embeddings are deterministic float32 vectors."""
+        embedding = rag_engine.embed_text("NACA 0012 symmetric airfoil")
+
+        assert embedding.dtype == np.float32
+        assert embedding.shape == (settings.embedding_dimension,)
+        assert np.array_equal(embedding, rag_engine.embed_text("NACA 0012 symmetric airfoil"))
 
-    def test_embed_text(self):
-        """Test text embedding via OpenAI."""
-        # Implementation in Week 1
-        pass
+    def test_openai_embeddings_are_faked(self):
+        """Test that OpenAI-provider engines get deterministic vectors offline."""
+        settings = Settings(embedding_provider="openai", openai_api_key="test-key")
+        engine = rag.RAGEngine(settings, embedding_cache=EmbeddingCache(capacity=0))
 
-    def test_add_airfoil(self):
+        first, second = engine.embed_batch(["NACA 0012", "NACA 2412"])
+
+        assert first.shape == (1536,)
+        assert not np.array_equal(first, second)
+        assert np.array_equal(asyncio.run(engine.aembed_text("NACA 0012")), first)
+
+    def test_add_airfoil(self, rag_engine, populated_collection):
         """Test adding an airfoil to vector store."""
-        # Implementation in Week 1
-        pass
+        rag_engine.add_airfoil(
+            "Eppler 423",
+            "Eppler 423 high-lift airfoil with 12.5% thickness",
+            {"name": "Eppler 423"},
+            "airfoil_eppler_423"
+        )
+
+        stored = populated_collection.get(ids=["airfoil_eppler_423"])
+        assert stored["documents"] == ["Eppler 423 high-lift airfoil with 12.5% thickness"]
+
+    def test_search_similar(self, rag_engine, populated_collection):
+        """Test that searching for a stored description finds it first."""
+        description = "NACA 2412 cambered airfoil with 12% thickness and 2% camber"
+
+        matches = rag_engine.search_similar(description, limit=3)
 
-    def test_search_similar(self):
-        """Test similarity search for airfoils."""
-        # Implementation in Week 1
-        pass
+        assert matches[0][0] == description
+        assert matches[0][1] == pytest.approx(1.0, abs=1e-5)
+        assert matches[0][2]["name"] == "NACA 2412"
 
     def test_similarity_threshold(self):
         """Test that similarity threshold filtering works."""
-        # Implementation in Week 1
-        pass
+        class FakeCollection:
+            def query(self, query_embeddings, n_results):
+                return {
+                    "documents": [["near", "mid", "far"], []],
+                    "distances": [[0.1, 0.5, 0.9], []],
+                    "metadatas": [[{"n": 1}, {"n": 2}, {"n": 3}], []],
+                }
+
+        settings = Settings(embedding_provider="local", rag_similarity_threshold=0.5)
+        engine = rag.RAGEngine(settings, embedding_cache=EmbeddingCache(capacity=0))
+        engine._collection = FakeCollection()
+
+        first, second = engine.search_by_embeddings([[1.0], [0.0]], limit=3)
+
+        assert [(doc, round(score, 6), meta) for doc, score, meta in first] == [
+            ("near", 0.9, {"n": 1}),
+            ("mid", 0.5, {"n": 2}),
+        ]
+        assert second == []
+
+    def test_configuration_results_match_validated_models(self):
+        """Test that unvalidated results equal fully validated ones."""
+        from app.models import SimilarConfigurationResult, WingSpecification
+
+        settings = Settings(embedding_provider="local")
+        engine = rag.RAGEngine(settings, embedding_cache=EmbeddingCache(capacity=0))
+        wing_spec = WingSpecification(
+            wing_type="single_element",
+            chord_mm=350,
+            span_mm=1400,
+            target_downforce_kg=45,
+            operating_speed_kph=200
+        )
+        metadata = {"airfoil_name": "NACA 4412", "max_cl": 1.6, "max_cd": 0.012}
+
+        (result,) = engine.to_configuration_results([("doc", 1.2, metadata)], wing_spec)
+
+        validated = SimilarConfigurationResult.model_validate(result.model_dump())
+        assert result == validated
+        assert result.similarity_score == 1.0
+        assert result.source == rag.DEFAULT_RESULT_SOURCE
+
+
+class TestLazyImports:
+    """Test that heavy client libraries load on first use."""
+
+    def test_import_skips_chromadb_and_openai(self):
+        """Test that importing the RAG module does not import chromadb or openai."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys, app.rag; "
+            "print(sorted({'chromadb', 'openai'} & set(sys.modules)))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).resolve().parents[1]
+        )
+
+        assert result.stdout.strip() == "[]"
+
+
+class TestOpenAIHttpClients:
+    """Test the pooled HTTP clients behind the OpenAI SDK."""
+
+    def test_clients_use_configured_timeout(self):
+        """Test that both clients get the embeddings API timeout."""
+        client, async_client = rag._openai_http_clients(Settings(openai_keepalive_expiry_s=60))
+
+        assert client.timeout.read == rag.OPENAI_TIMEOUT_S
+        assert async_client.timeout.connect == rag.OPENAI_CONNECT_TIMEOUT_S
+        client.close()
+        asyncio.run(async_client.aclose())
+
+    @pytest.mark.skipif(importlib.util.find_spec("h2") is not None, reason="h2 is installed")
+    def test_http2_without_h2_raises(self):
+        """Test that OPENAI_HTTP2 without h2 fails with an install hint."""
+        with pytest.raises(RuntimeError, match="http2"):
+            rag._openai_http_clients(Settings(openai_http2=True))
+
+
+class FakeAsyncEmbeddings:
+    """Stands in for AsyncOpenAI().embeddings, recording request sizes."""
+
+    def __init__(self):
+        self.requests: list[int] = []
+
+    async def create(self, input, model):
+        self.requests.append(len(input))
+        data = [
+            SimpleNamespace(index=i, embedding=[float(len(text))])
+            for i, text in enumerate(input)
+        ]
+        return SimpleNamespace(data=list(reversed(data)))
+
+
+class TestAsyncEmbedding:
+    """Test async embedding through the AsyncOpenAI client."""
+
+    def make_engine(self):
+        settings = Settings(embedding_provider="openai", openai_api_key="test-key")
+        engine = rag.RAGEngine(settings, embedding_cache=EmbeddingCache(capacity=16))
+        engine.aclient = SimpleNamespace(embeddings=FakeAsyncEmbeddings())
+        return engine
+
+    def test_aembed_batch_preserves_order(self):
+        """Test that results follow input order regardless of response order."""
+        engine = self.make_engine()
+
+        embeddings = asyncio.run(engine.aembed_batch(["a", "bbb", "cc"]))
+
+        assert [embedding.tolist() for embedding in embeddings] == [[1.0], [3.0], [2.0]]
+        assert embeddings[0].dtype == np.float32
+        assert engine.aclient.embeddings.requests == [3]
+
+    def test_aembed_batch_skips_cached_texts(self):
+        """Test that only uncached texts are sent to the provider."""
+        engine = self.make_engine()
+        asyncio.run(engine.aembed_text("a"))
+
+        asyncio.run(engine.aembed_batch(["a", "bb"]))
+
+        assert engine.aclient.embeddings.requests == [1, 1]
+
+    def test_aembed_batch_sends_repeated_texts_once(self):
+        """Test that identical texts in one batch share a single embedding."""
+        settings = Settings(embedding_provider="openai", openai_api_key="test-key")
+        engine = rag.RAGEngine(settings, embedding_cache=EmbeddingCache(capacity=0))
+        engine.aclient = SimpleNamespace(embeddings=FakeAsyncEmbeddings())
+
+        embeddings = asyncio.run(engine.aembed_batch(["a", "bb", "a", "bb", "a"]))
+
+        assert [embedding.tolist() for embedding in embeddings] == [
+            [1.0], [2.0], [1.0], [2.0], [1.0]
+        ]
+        assert engine.aclient.embeddings.requests == [2]
+
+    def test_persistent_cache_is_used_off_the_event_loop(self, tmp_path):
+        """Test that a SQLite-backed embedding cache is read and written in worker threads."""
+        threads: list[int] = []
+
+        class RecordingCache(EmbeddingCache):
+            def get(self, key):
+                threads.append(threading.get_ident())
+                return super().get(key)
+
+            def put_many(self, items):
+                threads.append(threading.get_ident())
+                super().put_many(items)
+
+        settings = Settings(embedding_provider="openai", openai_api_key="test-key")
+        cache = RecordingCache(capacity=16, path=tmp_path / "embeddings.sqlite3")
+        engine = rag.RAGEngine(settings, embedding_cache=cache)
+        engine.aclient = SimpleNamespace(embeddings=FakeAsyncEmbeddings())
+
+        asyncio.run(engine.aembed_batch(["a", "bb"]))
+        cache.close()
+
+        assert len(threads) == 3
+        assert threading.get_ident() not in threads
+        reopened = EmbeddingCache(capacity=16, path=tmp_path / "embeddings.sqlite3")
+        key = EmbeddingCache.make_key(engine._embedding_namespace, "bb")
+        assert reopened.get(key).tolist() == [2.0]
+        reopened.close()
 
 
 class TestVectorDatabase:
     """Test Chroma vector database operations."""
 
-    def test_collection_creation(self):
-        """Test that Chroma collection is created."""
-        # Implementation in Week 1
-        pass
+    def test_collection_creation(self, rag_engine, settings):
+        """Test that Chroma collection is created with a cosine HNSW index."""
+        hnsw = rag_engine.collection.configuration["hnsw"]
 
-    def test_collection_persistence(self):
+        assert rag_engine.collection.name == settings.rag_collection_name
+        assert hnsw["space"] == "cosine"
+        assert hnsw["max_neighbors"] == rag.CHROMA_HNSW_CONFIGURATION["max_neighbors"]
+
+    def test_collection_persistence(self, tmp_path):
         """Test that vectors persist across sessions."""
-        # Implementation in Week 1
-        pass
+        settings = Settings(
+            embedding_provider="local",
+            embedding_dimension=8,
+            chroma_path=tmp_path / "chroma"
+        )
+        engine = rag.RAGEngine(settings, embedding_cache=EmbeddingCache(capacity=0))
+        engine.add_airfoils_bulk([("NACA 0012", "symmetric airfoil", {}, "airfoil_naca_0012")])
+
+        reopened = rag.RAGEngine(settings, embedding_cache=EmbeddingCache(capacity=0))
+
+        stored = reopened.collection.get(ids=["airfoil_naca_0012"])
+        assert stored["documents"] == ["symmetric airfoil"]
+
+    def test_clear_collection(self, tmp_path):
+        """Test that clearing drops the data and leaves an empty collection ready."""
+        settings = Settings(
+            embedding_provider="local",
+            embedding_dimension=8,
+            chroma_path=tmp_path / "chroma"
+        )
+        engine = rag.RAGEngine(settings, embedding_cache=EmbeddingCache(capacity=0))
+        engine.add_airfoils_bulk([("NACA 0012", "symmetric airfoil", {}, "airfoil_naca_0012")])
+        old_collection = engine.collection
+
+        engine.clear_collection()
+
+        assert engine._collection is not None
+        assert engine._collection is not old_collection
+        assert engine.collection.count() == 0
+
+
+class TestBulkLoading:
+    """Test batching of airfoil inserts."""
+
+    def test_batches_respect_input_limit(self):
+        """Test that records are split into batches of at most max_inputs."""
+        records = [(f"A{i}", "description", {}, f"id_{i}") for i in range(5)]
+
+        batches = list(rag._embedding_batches(records, max_inputs=2))
+
+        assert [len(batch) for batch in batches] == [2, 2, 1]
+        assert [r for batch in batches for r in batch] == records
+
+    def test_batches_group_similar_lengths(self):
+        """Test that batches are formed from length-sorted descriptions."""
+        records = [(name, "x" * size, {}, name) for name, size in
+                   [("a", 40), ("b", 1), ("c", 30), ("d", 2)]]
+
+        batches = list(rag._embedding_batches(records, max_inputs=2))
+
+        assert [[r[0] for r in batch] for batch in batches] == [["b", "d"], ["c", "a"]]
+
+    def test_batches_respect_token_limit(self, monkeypatch):
+        """Test that a batch is closed before exceeding the token budget."""
+        monkeypatch.setattr(rag, "EMBEDDING_MAX_BATCH_TOKENS", 10)
+        records = [("A", "x" * 20, {}, "a"), ("B", "x" * 20, {}, "b")]
+
+        batches = list(rag._embedding_batches(records, max_inputs=100))
+
+        assert [len(batch) for batch in batches] == [1, 1]
+
+    def test_async_bulk_load_upserts_every_batch(self):
+        """Test that concurrent batch loading stores every record once."""
+        class RecordingCollection:
+            def __init__(self):
+                self.upserts = []
+
+            def upsert(self, ids, embeddings, documents, metadatas):
+                self.upserts.append((ids, metadatas))
+
+        settings = Settings(embedding_provider="local", embedding_dimension=8)
+        engine = rag.RAGEngine(settings, embedding_cache=EmbeddingCache(capacity=0))
+        engine._collection = RecordingCollection()
+        records = [(f"A{i}", f"description {i}", {"i": i}, f"id_{i}") for i in range(5)]
+
+        added = asyncio.run(engine.aadd_airfoils_bulk(records, batch_size=2, write_batch_size=2))
+
+        assert added == 5
+        assert sorted(len(ids) for ids, _ in engine._collection.upserts) == [1, 2, 2]
+        stored = {doc_id: meta for ids, metas in engine._collection.upserts
+                  for doc_id, meta in zip(ids, metas)}
+        assert stored["id_3"] == {"airfoil_name": "A3", "i": 3}
+
+    def test_bulk_load_writes_batched_separately_from_embeddings(self):
+        """Test that several embedded batches share one collection upsert."""
+        class RecordingCollection:
+            def __init__(self):
+                self.upserts = []
+
+            def upsert(self, ids, embeddings, documents, metadatas):
+                self.upserts.append(ids)
+
+        settings = Settings(embedding_provider="local", embedding_dimension=8)
+        engine = rag.RAGEngine(settings, embedding_cache=EmbeddingCache(capacity=0))
+        engine._collection = RecordingCollection()
+        records = [(f"A{i}", f"description {i}", {"i": i}, f"id_{i}") for i in range(5)]
+
+        added = engine.add_airfoils_bulk(records, batch_size=2, write_batch_size=4)
+
+        assert added == 5
+        assert [len(ids) for ids in engine._collection.upserts] == [4, 1]
+
+
+sqlite_vec_usable = (
+    importlib.util.find_spec("sqlite_vec") is not None
+    and hasattr(sqlite3.Connection, "enable_load_extension")
+)
+
+
+@pytest.mark.skipif(not sqlite_vec_usable, reason="sqlite-vec extension cannot be loaded")
+class TestSqliteVecCollection:
+    """Test the sqlite-vec vector store backend."""
+
+    def test_query_returns_nearest_first(self, tmp_path):
+        """Test that queries return Chroma-style results ordered by cosine distance."""
+        from app.vector_store import SqliteVecCollection
+
+        collection = SqliteVecCollection(tmp_path / "vectors.sqlite3", "airfoils", dimension=3)
+        collection.add(
+            ids=["a", "b"],
+            embeddings=[[1.0, 0.0, 0.0], [0.0, 1.0, 0.0]],
+            documents=["doc a", "doc b"],
+            metadatas=[{"max_cl": 1.2}, {"max_cl": 1.4}]
+        )
+
+        results = collection.query(query_embeddings=[[0.0, 1.0, 0.1]], n_results=2)
+
+        assert results["ids"] == [["b", "a"]]
+        assert results["metadatas"][0][0] == {"max_cl": 1.4}
+        assert results["distances"][0][0] < results["distances"][0][1]
+        collection.close()
+
+    def test_upsert_replaces_existing_ids(self, tmp_path):
+        """Test that upserting a stored id replaces its row instead of failing."""
+        from app.vector_store import SqliteVecCollection
+
+        collection = SqliteVecCollection(tmp_path / "vectors.sqlite3", "airfoils", dimension=3)
+        collection.add(
+            ids=["a"], embeddings=[[1.0, 0.0, 0.0]], documents=["old"], metadatas=[{}]
+        )
+        collection.upsert(
+            ids=["a", "b"],
+            embeddings=[[0.0, 1.0, 0.0], [0.0, 0.0, 1.0]],
+            documents=["new", "doc b"],
+            metadatas=[{"v": 2}, {}]
+        )
+
+        results = collection.query(query_embeddings=[[0.0, 1.0, 0.0]], n_results=1)
 
-    def test_clear_collection(self):
-        """Test clearing collection data."""
-        # Implementation in Week 1
-        pass
+        assert collection.count() == 2
+        assert results["documents"] == [["new"]]
+        collection.close()